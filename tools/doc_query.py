@@ -14,15 +14,299 @@ Usage:
     python3 tools/doc_query.py --query "phase*" --mode text
 """
 
-import argparse
+import copy
+import functools
+import heapq
 import json
+import operator
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Union
+from types import SimpleNamespace
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Tuple, Union
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+from json_output import write_json
+from yaml_stream import StreamUnsupported, iter_nodes
+
+
+# Scalar types produced by the YAML safe loader, listed so that walker
+# dispatch tables resolve them with a single exact-type lookup
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+# Queries made only of these characters render identically in a JSON dump
+# (no escaping) and can be used to reject whole files up front
+_BLOB_SAFE_QUERY = re.compile(r'[\w \-:/]+')
+
+
+def _is_blob_safe_literal(query: str) -> bool:
+    """
+    Check if a text query can be pre-screened against a file's JSON dump.
+    
+    The query must be a plain literal whose characters JSON never escapes.
+    It also must not be part of 'none': str(None) is 'None' but JSON
+    writes 'null', so such queries could match a leaf the dump hides.
+    """
+    return bool(_BLOB_SAFE_QUERY.fullmatch(query)) and query.lower() not in 'none'
+
+
+def _is_blob_safe_value(value: str) -> bool:
+    """
+    Check if a legacy '=' value must appear verbatim in a file's JSON dump.
+    
+    Numeric values can match differently written numbers, and bool/None
+    leaves stringify unlike their JSON form, so neither qualifies.
+    """
+    if value in ('True', 'False', 'None') or not _BLOB_SAFE_QUERY.fullmatch(value):
+        return False
+    try:
+        float(value)
+    except ValueError:
+        return True
+    return False
+
+
+_QUERY_CACHE_SIZE = 64
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Get a file's (mtime_ns, size), or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cached_query(method: Callable) -> Callable:
+    """
+    Memoize a query method per instance.
+    
+    Results are keyed by method, query and the mtimes of every discovered
+    file, so an edit to any of them invalidates earlier answers. Files a
+    query reads besides those (see _depend_on) are stamped with its entry
+    and re-checked on every hit. Callers always get their own deep copy,
+    so changing a result never changes later ones or the cached documents
+    it came from. The oldest entry is evicted once the cache is full.
+    """
+    @functools.wraps(method)
+    def wrapper(self, query: str, **options: Any) -> Dict[str, Any]:
+        key = (method.__name__, query, tuple(sorted(options.items())), self._files_token())
+        cache = self._query_cache
+        hit = cache.get(key)
+        if hit is not None and all(_file_stamp(path) == stamp for path, stamp in hit[1]):
+            return copy.deepcopy(hit[0])
+        
+        self._query_deps = []
+        try:
+            result = method(self, query, **options)
+            deps = tuple(self._query_deps)
+        finally:
+            self._query_deps = None
+        if len(cache) >= _QUERY_CACHE_SIZE and key not in cache:
+            del cache[next(iter(cache))]
+        cache[key] = (result, deps)
+        return copy.deepcopy(result)
+    
+    return wrapper
+
+
+_WORD_RE = re.compile(r'\w+')
+
+_YAML_SUFFIXES = ('.yaml', '.yml')
+
+
+def _walk_yaml_files(root: Path, recursive: bool = True) -> List[Path]:
+    """
+    List YAML files under a directory in a single scandir pass.
+    
+    Finds the same files as globbing '**/*.yaml' and '**/*.yml': every
+    directory is descended into, hidden ones included, but symlinked
+    directories are not followed.
+    """
+    found = []
+    pending = deque([root])
+    while pending:
+        current = pending.popleft()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name.endswith(_YAML_SUFFIXES) and entry.is_file():
+                        found.append(Path(entry.path))
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue
+    return found
+
+
+def _dispatch(handlers: Dict[type, Callable], node: Any, default: Callable) -> Callable:
+    """Look up the handler for node's exact type, using isinstance only on a miss."""
+    handler = handlers.get(type(node))
+    if handler is None:
+        handler = next((h for t, h in handlers.items() if isinstance(node, t)), default)
+    return handler
+
+
+# Path segments: a bracket group (closed by ']', or cut short by the next
+# '[' or the end), or a run of key characters, which a stray ']' closes
+_SEGMENT_RE = re.compile(r'\[[^\[\]]*\]?|[^.\[\]]*\]|[^.\[\]]+')
+
+# Path queries: 'path.to.node.{predicate}', or the legacy 'path.to.key=value'
+# (or '~pattern')
+_PREDICATE_QUERY_RE = re.compile(r'(.+)\.\{([^}]+)\}')
+_LEGACY_QUERY_RE = re.compile(r'([^=~]+)([=~])(.+)')
+
+
+@functools.lru_cache(maxsize=None)
+def _operator_pattern(operators: Tuple[str, ...]) -> re.Pattern:
+    """Compile the ' OP ' pattern used to split a predicate on boolean operators."""
+    return re.compile(' (?:%s) ' % '|'.join(map(re.escape, operators)))
+
+
+# Numeric comparisons behind the ordering operators
+_ORDERINGS = {'>': operator.gt, '<': operator.lt, '>=': operator.ge, '<=': operator.le}
+
+
+# Relative cost of each comparison operator, used to order AND/OR operands
+_OPERATOR_COSTS = {
+    '=': 1, '!=': 1,
+    '>': 2, '<': 2, '>=': 2, '<=': 2,
+    '~': 3, '!~': 3,
+}
+
+
+# Marks stack entries that were not reached through a mapping key
+_NO_KEY = object()
+
+
+def _push_mapping(node: Dict, path: str, stack: List) -> bool:
+    """Push a mapping's entries so they pop in document order."""
+    stack.extend(
+        (value, f"{path}.{key}" if path else key, key)
+        for key, value in reversed(node.items())
+    )
+    return True
+
+
+def _push_sequence(node: List, path: str, stack: List) -> bool:
+    """Push a sequence's items so they pop in document order."""
+    stack.extend(
+        (node[idx], f"{path}[{idx}]", _NO_KEY)
+        for idx in range(len(node) - 1, -1, -1)
+    )
+    return True
+
+
+def _push_nothing(node: Any, path: str, stack: List) -> bool:
+    """Leaves have no children; report that node is a leaf."""
+    return False
+
+
+# Stack-walker dispatch: containers push their children, scalars are leaves
+_CHILD_PUSHERS = {
+    dict: _push_mapping,
+    list: _push_sequence,
+    **dict.fromkeys(_SCALAR_TYPES, _push_nothing),
+}
+
+
+def _ignore(node: Any):
+    """Default handler for nodes a walker has nothing to do with."""
+
+
+def _walk_fields(data: Any, parts: Tuple[str, ...]) -> Any:
+    """Follow a pre-split field path (e.g. ('task', 'name')) through nested dicts."""
+    current = data
+    for part in parts:
+        if isinstance(current, dict) and part in current:
+            current = current[part]
+        else:
+            return None
+    return current
+
+
+def _never(data: Any) -> bool:
+    """Predicate that matches nothing."""
+    return False
+
+
+def _legacy_matches_value(actual: Any, operator: str, expected: str) -> bool:
+    """Check if a value matches using the given legacy path operator."""
+    if operator == '=':
+        # Try numeric comparison first
+        try:
+            return float(actual) == float(expected)
+        except (ValueError, TypeError):
+            pass
+        return str(actual) == expected
+    elif operator == '~':
+        # Regex match
+        try:
+            return bool(re.search(expected, str(actual), re.IGNORECASE))
+        except re.error:
+            return False
+    return False
+
+
+def _plan_key_step(key: str, next_step: Callable) -> Callable:
+    """Build a plan step that descends into a specific mapping key."""
+    def step(node: Any, path: str, value: str, out: List[Dict]):
+        if isinstance(node, dict) and key in node:
+            next_step(node[key], f"{path}.{key}" if path else key, value, out)
+    return step
+
+
+def _plan_wildcard_step(next_step: Callable) -> Callable:
+    """Build a plan step that fans out over every list item or mapping value."""
+    def step(node: Any, path: str, value: str, out: List[Dict]):
+        if isinstance(node, list):
+            for idx, item in enumerate(node):
+                next_step(item, f"{path}[{idx}]", value, out)
+        elif isinstance(node, dict):
+            for key, item in node.items():
+                next_step(item, f"{path}.{key}" if path else key, value, out)
+    return step
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_path_plan(path_str: str, operator: str) -> Callable[[Any, str], List[Dict]]:
+    """
+    Compile a legacy path query (path.to.key[*].subkey) into a plan.
+    
+    The plan is a chain of closures specialised for the path shape, so
+    repeated queries that only differ in their value skip re-parsing.
+    """
+    parts = [p.rstrip(']') for p in re.split(r'[.\[]', path_str) if p]
+    
+    def emit(node: Any, path: str, value: str, out: List[Dict]):
+        # Reached the end, check value
+        if _legacy_matches_value(node, operator, value):
+            out.append({
+                "path": path,
+                "value": node
+            })
+    
+    step = emit
+    for part in reversed(parts):
+        step = _plan_wildcard_step(step) if part == '*' else _plan_key_step(part, step)
+    
+    def plan(data: Any, value: str) -> List[Dict]:
+        matches = []
+        step(data, "", value, matches)
+        return matches
+    
+    return plan
+
 
 class PredicateParser:
     """Parse and evaluate predicate expressions."""
@@ -109,45 +393,23 @@ class PredicateParser:
     def _split_by_operator(self, expr: str, operators: List[str]) -> List[str]:
         """Split expression by operators, respecting parentheses."""
         parts = []
-        current = ""
-        depth = 0
-        i = 0
-        
-        while i < len(expr):
-            char = expr[i]
-            
-            if char == '(':
-                depth += 1
-                current += char
-                i += 1
-            elif char == ')':
-                depth -= 1
-                current += char
-                i += 1
-            elif depth == 0:
-                # Check if we're at an operator (must be surrounded by spaces or at boundaries)
-                found_op = False
-                for op in operators:
-                    # Check for operator with spaces around it
-                    op_with_spaces = f' {op} '
-                    if expr[i:i+len(op_with_spaces)] == op_with_spaces:
-                        # Found operator at top level
-                        if current.strip():
-                            parts.append(current.strip())
-                        current = ""
-                        i += len(op_with_spaces)
-                        found_op = True
-                        break
-                
-                if not found_op:
-                    current += char
-                    i += 1
-            else:
-                current += char
-                i += 1
+        start = 0
+        has_parens = '(' in expr or ')' in expr
+        
+        # Operators must be surrounded by single spaces
+        for match in _operator_pattern(tuple(operators)).finditer(expr):
+            pos = match.start()
+            # Only split at top level (paren depth 0 before the operator)
+            if has_parens and expr.count('(', 0, pos) != expr.count(')', 0, pos):
+                continue
+            part = expr[start:pos].strip()
+            if part:
+                parts.append(part)
+            start = match.end()
         
-        if current.strip():
-            parts.append(current.strip())
+        part = expr[start:].strip()
+        if part:
+            parts.append(part)
         
         return parts if len(parts) > 1 else [expr]
     
@@ -186,22 +448,135 @@ class PredicateParser:
         
         return False
     
+    def compile(self, predicate_str: str) -> Callable[[Any], bool]:
+        """Parse a predicate string and compile it into a callable."""
+        return self._compile_node(self.parse(predicate_str))
+    
+    def _compile_node(self, predicate: Dict[str, Any]) -> Callable[[Any], bool]:
+        """
+        Compile an expression tree into a chain of closures.
+        
+        The compiled callable gives the same answers as evaluate() but does
+        the type dispatch once, up front, instead of on every node visited.
+        """
+        pred_type = predicate.get('type')
+        
+        if pred_type == 'or':
+            operands = tuple(self._compile_node(op) for op in self._by_cost(predicate['operands']))
+            return lambda data: any(f(data) for f in operands)
+        
+        if pred_type == 'and':
+            operands = tuple(self._compile_node(op) for op in self._by_cost(predicate['operands']))
+            return lambda data: all(f(data) for f in operands)
+        
+        if pred_type == 'not':
+            inner = self._compile_node(predicate['operand'])
+            return lambda data: not inner(data)
+        
+        if pred_type == 'comparison':
+            return self._compile_comparison(
+                predicate['field'], predicate['operator'], predicate['value']
+            )
+        
+        if pred_type == 'exists':
+            parts = tuple(predicate['field'].split('.'))
+            return lambda data: _walk_fields(data, parts) is not None
+        
+        return _never
+    
+    def _by_cost(self, operands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Order AND/OR operands cheapest first so short-circuiting skips the
+        expensive ones (typically regexes). The sort is stable, so equal-cost
+        operands keep their source order.
+        """
+        return sorted(operands, key=self._estimate_cost)
+    
+    def _estimate_cost(self, predicate: Dict[str, Any]) -> int:
+        """Static evaluation cost estimate for an expression tree."""
+        pred_type = predicate.get('type')
+        if pred_type == 'comparison':
+            return _OPERATOR_COSTS.get(predicate['operator'], 3)
+        if pred_type == 'not':
+            return self._estimate_cost(predicate['operand']) + 1
+        if pred_type in ('and', 'or'):
+            return max(self._estimate_cost(op) for op in predicate['operands']) + 1
+        # 'exists' is a bare field lookup
+        return 0
+    
+    def _compile_comparison(self, field: str, operator: str, expected: str) -> Callable[[Any], bool]:
+        """Compile a comparison with its field path split and its regex built once."""
+        parts = tuple(field.split('.'))
+        
+        if operator in ('~', '!~'):
+            try:
+                search = re.compile(expected, re.IGNORECASE).search
+            except re.error:
+                # An invalid pattern never matches, so '!~' always holds
+                matched = lambda actual: False
+            else:
+                matched = lambda actual: search(str(actual)) is not None
+            test = matched if operator == '~' else (lambda actual: not matched(actual))
+        elif operator in ('=', '!='):
+            test = self._compile_equals(expected)
+            if operator == '!=':
+                equals = test
+                test = lambda actual: not equals(actual)
+        elif operator in _ORDERINGS:
+            test = self._compile_ordering(_ORDERINGS[operator], expected)
+            if test is None:
+                # A non-numeric bound never compares true
+                return _never
+        else:
+            op_func = self.operators.get(operator)
+            if op_func is None:
+                return _never
+            test = lambda actual: op_func(actual, expected)
+        
+        def compare(data: Any) -> bool:
+            actual = _walk_fields(data, parts)
+            return actual is not None and test(actual)
+        return compare
+    
+    @staticmethod
+    def _compile_equals(expected: str) -> Callable[[Any], bool]:
+        """Build an equality test with the numeric/string choice made up front."""
+        try:
+            number = float(expected)
+        except ValueError:
+            # Same outcome as _op_equals once float(expected) fails
+            return lambda actual: str(actual) == expected
+        
+        def equals(actual: Any) -> bool:
+            try:
+                return float(actual) == number
+            except (ValueError, TypeError):
+                return str(actual) == expected
+        return equals
+    
+    @staticmethod
+    def _compile_ordering(compare: Callable[[float, float], bool],
+                          expected: str) -> Optional[Callable[[Any], bool]]:
+        """Build a numeric ordering test, or None if the bound is not a number."""
+        try:
+            number = float(expected)
+        except ValueError:
+            return None
+        
+        def ordered(actual: Any) -> bool:
+            try:
+                return compare(float(actual), number)
+            except (ValueError, TypeError):
+                return False
+        return ordered
+    
     def _get_field_value(self, data: Any, field: str) -> Any:
         """Get a field value from data, supporting nested paths."""
         if not isinstance(data, dict):
             return None
         
         # Handle nested field paths (e.g., "task.name")
-        parts = field.split('.')
-        current = data
-        
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None
-        
-        return current
+        return _walk_fields(data, field.split('.'))
     
     def _op_equals(self, actual: Any, expected: str) -> bool:
         """Equality comparison."""
@@ -257,41 +632,247 @@ class PredicateParser:
             return False
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_predicate(predicate_str: str) -> Callable[[Any], bool]:
+    """Compile a predicate string once per process."""
+    return PredicateParser().compile(predicate_str)
+
+
+def _plan_item_step(next_step: Callable) -> Callable:
+    """Build a predicate plan step that fans out over every list item ('[*]')."""
+    def step(node: Any, path: str, out: List[Dict]):
+        if type(node) is list:
+            for idx, item in enumerate(node):
+                next_step(item, f"{path}[{idx}]", out)
+    return step
+
+
+def _plan_index_step(index: int, segment: str, next_step: Callable) -> Callable:
+    """Build a predicate plan step that picks one list item ('[n]')."""
+    def step(node: Any, path: str, out: List[Dict]):
+        if type(node) is list and 0 <= index < len(node):
+            next_step(node[index], f"{path}{segment}", out)
+    return step
+
+
+def _plan_field_step(key: str, next_step: Callable) -> Callable:
+    """Build a predicate plan step that descends into a mapping key."""
+    def step(node: Any, path: str, out: List[Dict]):
+        if type(node) is dict and key in node:
+            next_step(node[key], f"{path}.{key}" if path else key, out)
+    return step
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_predicate_plan(path_str: str, predicate_str: str) -> Callable[[Any], List[Dict]]:
+    """
+    Compile a predicate query (path.to.node[*].{predicate}) into a plan.
+    
+    Like _compile_path_plan, the plan is a chain of closures specialised
+    for the path, ending in the compiled predicate, so a query is parsed
+    once per process and nothing is re-dispatched per node. Containers are
+    checked with exact type tests: the safe loader only produces plain
+    dicts and lists.
+    """
+    predicate = _compile_predicate(predicate_str)
+    
+    def emit(node: Any, path: str, out: List[Dict]):
+        # Reached end of path, evaluate predicate
+        if predicate(node):
+            out.append({
+                "path": path,
+                "value": node  # Return the ancestor node
+            })
+    
+    step = emit
+    for segment in reversed(_SEGMENT_RE.findall(path_str)):
+        if segment == '[*]':
+            step = _plan_item_step(step)
+        elif segment.startswith('[') and segment.endswith(']'):
+            try:
+                step = _plan_index_step(int(segment[1:-1]), segment, step)
+            except ValueError:
+                # An unparseable index never matches
+                return lambda data: []
+        else:
+            step = _plan_field_step(segment, step)
+    
+    def plan(data: Any) -> List[Dict]:
+        matches = []
+        step(data, "", matches)
+        return matches
+    
+    return plan
+
+
 class EnhancedDocQuery:
     """Enhanced document query tool with predicate support."""
     
-    def __init__(self, base_path: str = "."):
-        """Initialize the tool with the project base path."""
+    def __init__(self, base_path: str = ".", max_workers: Optional[int] = None):
+        """
+        Initialize the tool with the project base path.
+        
+        Args:
+            base_path: Project root to search
+            max_workers: Threads used to load and scan files (default: CPU count;
+                1 scans serially)
+        """
         self.base_path = Path(base_path)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool: Optional[ThreadPoolExecutor] = None
         self.spec_dirs = ["spec", "log", "man"]
         self.yaml_files = []
         self.predicate_parser = PredicateParser()
+        self._predicate_cache: Dict[str, Callable[[Any], bool]] = {}
+        self._yaml_cache: Dict[Path, Tuple[int, Any]] = {}
+        self._blob_cache: Dict[Path, Tuple[Any, str]] = {}
+        self._key_index: Dict[Path, Tuple[Any, FrozenSet]] = {}
+        self._keyword_cache: Dict[Path, Tuple[Any, FrozenSet[str]]] = {}
+        self._query_cache: Dict[Tuple, Tuple[Dict[str, Any], Tuple]] = {}
+        # Extra files read by the cached query running now, with their stamps
+        self._query_deps: Optional[List[Tuple[Path, Optional[Tuple[int, int]]]]] = None
         self._discover_files()
     
     def _discover_files(self):
         """Discover all YAML files in relevant directories."""
         for dir_name in self.spec_dirs:
             dir_path = self.base_path / dir_name
-            if dir_path.exists():
-                self.yaml_files.extend(dir_path.glob("**/*.yaml"))
-                self.yaml_files.extend(dir_path.glob("**/*.yml"))
+            if dir_path.is_dir():
+                self.yaml_files.extend(_walk_yaml_files(dir_path))
         
         # Also check for YAML files in root directory
-        for yaml_file in self.base_path.glob("*.yaml"):
-            if yaml_file.is_file():
-                self.yaml_files.append(yaml_file)
-        for yaml_file in self.base_path.glob("*.yml"):
-            if yaml_file.is_file():
-                self.yaml_files.append(yaml_file)
+        self.yaml_files.extend(_walk_yaml_files(self.base_path, recursive=False))
+    
+    def _files_token(self) -> Tuple[Optional[int], ...]:
+        """Return a token that changes whenever any discovered file changes."""
+        token = []
+        for file_path in self.yaml_files:
+            try:
+                token.append(file_path.stat().st_mtime_ns)
+            except OSError:
+                token.append(None)
+        return tuple(token)
     
     def _load_yaml_safe(self, file_path: Path) -> Optional[Dict]:
-        """Safely load a YAML file, returning None on error."""
+        """
+        Safely load a YAML file, returning None on error.
+        
+        Parsed documents are cached per file and reused until the file's
+        mtime changes, so running several queries on one instance parses
+        each file once.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
-        except Exception as e:
+            mtime = file_path.stat().st_mtime_ns
+        except OSError:
             return None
+        
+        entry = self._yaml_cache.get(file_path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        
+        try:
+            # libyaml decodes the raw bytes itself
+            with open(file_path, 'rb') as f:
+                data = yaml.load(f, Loader=_Loader)
+        except Exception as e:
+            data = None
+        
+        self._yaml_cache[file_path] = (mtime, data)
+        return data
+    
+    def _depend_on(self, file_path: Path) -> None:
+        """
+        Record that the running cached query reads file_path.
+        
+        Call before reading it: the stamp taken now is what a cached answer
+        is checked against, so an edit made during the query still counts.
+        """
+        if self._query_deps is not None:
+            self._query_deps.append((file_path, _file_stamp(file_path)))
+    
+    def _is_cached(self, file_path: Path) -> bool:
+        """Check if a file's parsed document is cached and still current."""
+        entry = self._yaml_cache.get(file_path)
+        if entry is None:
+            return False
+        try:
+            return entry[0] == file_path.stat().st_mtime_ns
+        except OSError:
+            return False
+    
+    def _json_blob(self, file_path: Path, data: Any) -> Optional[str]:
+        """
+        Return the JSON dump of a loaded file, cached until the file is reparsed.
+        
+        Returns None for documents JSON can't represent, such as mappings
+        with date keys (default= only applies to values); such files can't
+        be pre-screened and must be walked.
+        """
+        entry = self._blob_cache.get(file_path)
+        if entry is not None and entry[0] is data:
+            return entry[1]
+        try:
+            blob = json.dumps(data, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            blob = None
+        self._blob_cache[file_path] = (data, blob)
+        return blob
+    
+    def _file_keys(self, file_path: Path, data: Any) -> FrozenSet:
+        """Return every mapping key used in a loaded file, cached until it is reparsed."""
+        entry = self._key_index.get(file_path)
+        if entry is not None and entry[0] is data:
+            return entry[1]
+        
+        keys = set()
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                keys.update(node)
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        
+        keys = frozenset(keys)
+        self._key_index[file_path] = (data, keys)
+        return keys
+    
+    def _map_files(self, fn: Callable[[Path], Any]) -> List[Any]:
+        """Apply fn to every discovered file, in parallel, preserving file order."""
+        if self.max_workers <= 1 or len(self.yaml_files) <= 1:
+            return [fn(file_path) for file_path in self.yaml_files]
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return list(self._pool.map(fn, self.yaml_files))
+    
+    def _scan_files(self, scan: Callable[[Path, Any], List[Dict]]) -> List[Dict]:
+        """
+        Load every discovered file and run scan(file_path, data) over it.
+        
+        Returns:
+            One {"file", "results"} record per file with matches, in file order
+        """
+        def scan_one(file_path: Path) -> Optional[List[Dict]]:
+            data = self._load_yaml_safe(file_path)
+            if data is None:
+                return None
+            return scan(file_path, data)
+        
+        return self._collect_matches(self._map_files(scan_one))
     
+    def _collect_matches(self, per_file: List[Optional[List[Dict]]]) -> List[Dict]:
+        """Pair per-file results with their files, dropping files without matches."""
+        matches = []
+        for file_path, results in zip(self.yaml_files, per_file):
+            if results:
+                matches.append({
+                    "file": str(file_path.relative_to(self.base_path)),
+                    "results": results
+                })
+        return matches
+    
+    @_cached_query
     def query_task(self, task_id: str) -> Dict[str, Any]:
         """
         Query for a specific task by ID.
@@ -314,6 +895,7 @@ class EnhancedDocQuery:
         
         # Search master_todo.yaml
         master_todo = self.base_path / "master_todo.yaml"
+        self._depend_on(master_todo)
         if master_todo.exists():
             data = self._load_yaml_safe(master_todo)
             # Search current section
@@ -356,6 +938,7 @@ class EnhancedDocQuery:
         
         # Search tasks_completed.yaml
         completed = self.base_path / "log" / "tasks_completed.yaml"
+        self._depend_on(completed)
         if completed.exists():
             data = self._load_yaml_safe(completed)
             if data and "tasks" in data:
@@ -375,6 +958,7 @@ class EnhancedDocQuery:
         log_dir = self.base_path / "log"
         if log_dir.exists():
             summary = log_dir / f"task_{task_id}_summary.yaml"
+            self._depend_on(summary)
             if summary.exists():
                 results["related_files"].append({
                     "type": "summary",
@@ -383,6 +967,7 @@ class EnhancedDocQuery:
                 })
             
             notes = log_dir / f"task_{task_id}_notes.yaml"
+            self._depend_on(notes)
             if notes.exists():
                 results["related_files"].append({
                     "type": "notes",
@@ -393,6 +978,7 @@ class EnhancedDocQuery:
         # Find prompt file if specified
         if results["current_task"] and results["current_task"]["prompt_file"]:
             prompt_file = self.base_path / results["current_task"]["prompt_file"]
+            self._depend_on(prompt_file)
             if prompt_file.exists():
                 try:
                     with open(prompt_file, 'r') as f:
@@ -406,6 +992,7 @@ class EnhancedDocQuery:
         
         return results
     
+    @_cached_query
     def query_path(self, path_query: str) -> Dict[str, Any]:
         """
         Query using structured path notation with optional predicates.
@@ -434,7 +1021,7 @@ class EnhancedDocQuery:
         """Handle path queries with predicate syntax."""
         # Parse path and predicate
         # Format: path.to.node[*].{predicate}
-        match = re.match(r'(.+)\.\{([^}]+)\}', path_query)
+        match = _PREDICATE_QUERY_RE.match(path_query)
         if not match:
             results["error"] = "Invalid predicate syntax. Use: path.to.node.{field=value}"
             return results
@@ -442,188 +1029,62 @@ class EnhancedDocQuery:
         path_str = match.group(1)
         predicate_str = match.group(2)
         
-        # Parse the predicate
+        # Parse and compile the predicate
         try:
-            predicate = self.predicate_parser.parse(predicate_str)
+            self._compile_predicate(predicate_str)
         except Exception as e:
             results["error"] = f"Failed to parse predicate: {e}"
             return results
         
+        # The whole query is the same for every file, so compile it once
+        plan = _compile_predicate_plan(path_str, predicate_str)
+        
         # Search all files
-        for file_path in self.yaml_files:
-            data = self._load_yaml_safe(file_path)
-            if data is None:
-                continue
-            
-            matches = self._search_path_predicate(data, path_str, predicate)
-            if matches:
-                rel_path = str(file_path.relative_to(self.base_path))
-                results["matches"].append({
-                    "file": rel_path,
-                    "results": matches
-                })
+        results["matches"] = self._scan_files(lambda file_path, data: plan(data))
         
         return results
     
-    def _search_path_predicate(self, data: Any, path: str, predicate: Dict) -> List[Dict]:
-        """Search using path with predicate evaluation."""
-        matches = []
-        
-        # Split path into segments
-        segments = self._parse_path_segments(path)
-        
-        # Traverse the path
-        def traverse(current_data: Any, segment_idx: int, current_path: str):
-            if segment_idx >= len(segments):
-                # Reached end of path, evaluate predicate
-                if self.predicate_parser.evaluate(predicate, current_data):
-                    matches.append({
-                        "path": current_path,
-                        "value": current_data  # Return the ancestor node
-                    })
-                return
-            
-            segment = segments[segment_idx]
-            
-            if segment == '[*]':
-                # Wildcard - iterate through array
-                if isinstance(current_data, list):
-                    for idx, item in enumerate(current_data):
-                        new_path = f"{current_path}[{idx}]"
-                        traverse(item, segment_idx + 1, new_path)
-            elif segment.startswith('[') and segment.endswith(']'):
-                # Specific index
-                try:
-                    idx = int(segment[1:-1])
-                    if isinstance(current_data, list) and 0 <= idx < len(current_data):
-                        new_path = f"{current_path}{segment}"
-                        traverse(current_data[idx], segment_idx + 1, new_path)
-                except ValueError:
-                    pass
-            else:
-                # Regular key
-                if isinstance(current_data, dict) and segment in current_data:
-                    new_path = f"{current_path}.{segment}" if current_path else segment
-                    traverse(current_data[segment], segment_idx + 1, new_path)
-        
-        traverse(data, 0, "")
-        return matches
+    def _compile_predicate(self, predicate_str: str) -> Callable[[Any], bool]:
+        """Compile a predicate string, reusing earlier compilations."""
+        predicate = self._predicate_cache.get(predicate_str)
+        if predicate is None:
+            predicate = _compile_predicate(predicate_str)
+            self._predicate_cache[predicate_str] = predicate
+        return predicate
     
     def _parse_path_segments(self, path: str) -> List[str]:
         """Parse path string into segments."""
         # Split on dots, but keep array notation together
-        segments = []
-        current = ""
-        in_brackets = False
-        
-        for char in path:
-            if char == '[':
-                if current:
-                    segments.append(current)
-                    current = ""
-                in_brackets = True
-                current = char
-            elif char == ']':
-                current += char
-                segments.append(current)
-                current = ""
-                in_brackets = False
-            elif char == '.' and not in_brackets:
-                if current:
-                    segments.append(current)
-                    current = ""
-            else:
-                current += char
-        
-        if current:
-            segments.append(current)
-        
-        return segments
+        return _SEGMENT_RE.findall(path)
     
     def _query_path_legacy(self, path_query: str, results: Dict) -> Dict:
         """Handle legacy path queries (without predicates)."""
         # Parse the path query
         # Format: path.to.key[*].subkey=value or path.to.key~"pattern"
-        match = re.match(r'([^=~]+)([=~])(.+)', path_query)
+        match = _LEGACY_QUERY_RE.match(path_query)
         if not match:
             results["error"] = "Invalid path query format. Use: path.to.key=value or path.to.key~pattern"
             return results
         
         path_str, operator, value = match.groups()
         value = value.strip('"\'')
+        plan = _compile_path_plan(path_str, operator)
+        # Files whose JSON dump lacks a literal '=' value cannot match it
+        prefilter = operator == '=' and _is_blob_safe_value(value)
+        
+        def scan(file_path: Path, data: Any) -> List[Dict]:
+            if prefilter:
+                blob = self._json_blob(file_path, data)
+                if blob is not None and value not in blob:
+                    return []
+            return plan(data, value)
         
         # Search all files
-        for file_path in self.yaml_files:
-            data = self._load_yaml_safe(file_path)
-            if data is None:
-                continue
-            
-            matches = self._search_path_legacy(data, path_str, operator, value, "")
-            if matches:
-                rel_path = str(file_path.relative_to(self.base_path))
-                results["matches"].append({
-                    "file": rel_path,
-                    "results": matches
-                })
+        results["matches"] = self._scan_files(scan)
         
         return results
     
-    def _search_path_legacy(self, data: Any, path: str, operator: str, value: str, current_path: str) -> List[Dict]:
-        """Legacy search implementation."""
-        matches = []
-        
-        # Split path into parts
-        parts = re.split(r'[.\[]', path)
-        parts = [p.rstrip(']') for p in parts if p]
-        
-        def traverse(current_data: Any, part_idx: int, path_so_far: str):
-            if part_idx >= len(parts):
-                # Reached the end, check value
-                if self._matches_value(current_data, operator, value):
-                    matches.append({
-                        "path": path_so_far,
-                        "value": current_data
-                    })
-                return
-            
-            part = parts[part_idx]
-            
-            if part == '*':
-                # Wildcard
-                if isinstance(current_data, list):
-                    for idx, item in enumerate(current_data):
-                        new_path = f"{path_so_far}[{idx}]"
-                        traverse(item, part_idx + 1, new_path)
-                elif isinstance(current_data, dict):
-                    for key, item in current_data.items():
-                        new_path = f"{path_so_far}.{key}" if path_so_far else key
-                        traverse(item, part_idx + 1, new_path)
-            else:
-                # Specific key
-                if isinstance(current_data, dict) and part in current_data:
-                    new_path = f"{path_so_far}.{part}" if path_so_far else part
-                    traverse(current_data[part], part_idx + 1, new_path)
-        
-        traverse(data, 0, "")
-        return matches
-    
-    def _matches_value(self, actual: Any, operator: str, expected: str) -> bool:
-        """Check if a value matches using the given operator."""
-        if operator == '=':
-            # Try numeric comparison first
-            try:
-                return float(actual) == float(expected)
-            except (ValueError, TypeError):
-                pass
-            return str(actual) == expected
-        elif operator == '~':
-            # Regex match
-            try:
-                return bool(re.search(expected, str(actual), re.IGNORECASE))
-            except re.error:
-                return False
-        return False
-    
+    @_cached_query
     def query_text(self, query: str) -> Dict[str, Any]:
         """
         Search for text across all YAML files.
@@ -644,92 +1105,149 @@ class EnhancedDocQuery:
             return results
         
         # Search all files
-        for file_path in self.yaml_files:
+        # A plain-word query can be ruled out for a whole file with one
+        # search over its JSON dump before paying for the recursive walk
+        fast_reject = _is_blob_safe_literal(query)
+        
+        def scan_one(file_path: Path) -> Optional[List[Dict]]:
+            # Files not parsed yet are searched straight off the event stream
+            if not self._is_cached(file_path):
+                found = self._search_text_stream(file_path, regex)
+                if found is not None:
+                    return found
+            
             data = self._load_yaml_safe(file_path)
             if data is None:
-                continue
-            
-            matches = self._search_text_recursive(data, regex, "")
-            if matches:
-                rel_path = str(file_path.relative_to(self.base_path))
-                results["matches"].append({
-                    "file": rel_path,
-                    "results": matches
-                })
+                return None
+            if fast_reject:
+                blob = self._json_blob(file_path, data)
+                if blob is not None and not regex.search(blob):
+                    return []
+            return self._search_text_recursive(data, regex, "")
+        
+        results["matches"] = self._collect_matches(self._map_files(scan_one))
         
         return results
     
     def _search_text_recursive(self, data: Any, regex: re.Pattern, path: str) -> List[Dict]:
-        """Recursively search for text matches."""
+        """Search for text matches, walking the tree with an explicit stack."""
         matches = []
+        stack = [(data, path, _NO_KEY)]
         
-        if isinstance(data, dict):
-            for key, value in data.items():
-                new_path = f"{path}.{key}" if path else key
-                # Check key
-                if regex.search(str(key)):
-                    matches.append({
-                        "path": new_path,
-                        "match_type": "key",
-                        "value": value
-                    })
-                # Recurse into value
-                matches.extend(self._search_text_recursive(value, regex, new_path))
-        elif isinstance(data, list):
-            for idx, item in enumerate(data):
-                new_path = f"{path}[{idx}]"
-                matches.extend(self._search_text_recursive(item, regex, new_path))
-        else:
-            # Leaf value - check if it matches
-            if regex.search(str(data)):
+        while stack:
+            node, node_path, key = stack.pop()
+            # Check key
+            if key is not _NO_KEY and regex.search(str(key)):
                 matches.append({
-                    "path": path,
-                    "match_type": "value",
-                    "value": data
+                    "path": node_path,
+                    "match_type": "key",
+                    "value": node
                 })
+            
+            if not _dispatch(_CHILD_PUSHERS, node, _push_nothing)(node, node_path, stack):
+                # Leaf value - check if it matches
+                if regex.search(str(node)):
+                    matches.append({
+                        "path": node_path,
+                        "match_type": "value",
+                        "value": node
+                    })
         
         return matches
     
-    def query_key(self, key: str) -> Dict[str, Any]:
-        """Search for a specific YAML key across all files."""
+    def _search_text_stream(self, file_path: Path, regex: re.Pattern) -> Optional[List[Dict]]:
+        """
+        Search a file's YAML event stream without building its object tree.
+        
+        Finds the same matches as _search_text_recursive on the loaded
+        document; only subtrees whose key matched are built, since their
+        value is reported. Returns None if the document needs a full load.
+        """
+        matches = []
+        try:
+            with open(file_path, 'rb') as f:
+                loader = _Loader(f)
+                try:
+                    for path, _, value, key_hit, is_leaf in iter_nodes(loader, regex.search):
+                        if key_hit:
+                            matches.append({
+                                "path": path,
+                                "match_type": "key",
+                                "value": value
+                            })
+                        if is_leaf and regex.search(str(value)):
+                            matches.append({
+                                "path": path,
+                                "match_type": "value",
+                                "value": value
+                            })
+                finally:
+                    loader.dispose()
+        except StreamUnsupported:
+            return None
+        except Exception:
+            # yaml.load fails on the same input, so the file has no matches
+            return []
+        return matches
+    
+    @_cached_query
+    def query_key(
+        self,
+        key: str,
+        *,
+        first_only: bool = False,
+        recurse_into_matches: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Search for a specific YAML key across all files.
+        
+        Args:
+            key: Key to search for
+            first_only: Report at most one occurrence per file
+            recurse_into_matches: Also search inside the values of matched keys
+        """
         results = {
             "query": key,
             "mode": "key_search",
             "matches": []
         }
         
-        for file_path in self.yaml_files:
-            data = self._load_yaml_safe(file_path)
-            if data is None:
-                continue
-            
-            matches = self._search_key_recursive(data, key, "")
-            if matches:
-                rel_path = str(file_path.relative_to(self.base_path))
-                results["matches"].append({
-                    "file": rel_path,
-                    "results": matches
-                })
+        def scan(file_path: Path, data: Any) -> List[Dict]:
+            # Skip the walk for files that do not use the key anywhere
+            if key not in self._file_keys(file_path, data):
+                return []
+            return self._search_key_recursive(
+                data, key, "", first_only, recurse_into_matches
+            )
+        
+        results["matches"] = self._scan_files(scan)
         
         return results
     
-    def _search_key_recursive(self, data: Any, target_key: str, path: str) -> List[Dict]:
-        """Recursively search for a specific key."""
+    def _search_key_recursive(
+        self,
+        data: Any,
+        target_key: str,
+        path: str,
+        first_only: bool = False,
+        recurse_into_matches: bool = True
+    ) -> List[Dict]:
+        """Search for a specific key, walking the tree with an explicit stack."""
         matches = []
+        stack = [(data, path, _NO_KEY)]
         
-        if isinstance(data, dict):
-            for key, value in data.items():
-                new_path = f"{path}.{key}" if path else key
-                if key == target_key:
-                    matches.append({
-                        "path": new_path,
-                        "value": value
-                    })
-                matches.extend(self._search_key_recursive(value, target_key, new_path))
-        elif isinstance(data, list):
-            for idx, item in enumerate(data):
-                new_path = f"{path}[{idx}]"
-                matches.extend(self._search_key_recursive(item, target_key, new_path))
+        while stack:
+            node, node_path, key = stack.pop()
+            if key is not _NO_KEY and key == target_key:
+                matches.append({
+                    "path": node_path,
+                    "value": node
+                })
+                if first_only:
+                    break
+                if not recurse_into_matches:
+                    continue
+            _dispatch(_CHILD_PUSHERS, node, _push_nothing)(node, node_path, stack)
         
         return matches
     
@@ -772,54 +1290,75 @@ class EnhancedDocQuery:
             return results
         
         # Extract keywords from target file
-        target_keywords = self._extract_keywords(target_data)
+        target_keywords = self._file_keywords(target_path, target_data)
         
-        # Score other files
-        scored_files = []
-        for file_path in self.yaml_files:
+        def score_file(file_path: Path) -> float:
             if file_path == target_path:
-                continue
-            
+                return 0.0
             data = self._load_yaml_safe(file_path)
             if data is None:
-                continue
-            
-            file_keywords = self._extract_keywords(data)
-            score = self._calculate_similarity(target_keywords, file_keywords)
-            
-            if score > 0:
-                rel_path = str(file_path.relative_to(self.base_path))
-                scored_files.append({
-                    "file": rel_path,
-                    "relevance_score": score
-                })
+                return 0.0
+            return self._calculate_similarity(target_keywords, self._file_keywords(file_path, data))
         
-        # Sort by score and return top results
-        scored_files.sort(key=lambda x: x["relevance_score"], reverse=True)
-        results["related"] = scored_files[:max_results]
+        # Score other files
+        scored = [
+            (file_path, score)
+            for file_path, score in zip(self.yaml_files, self._map_files(score_file))
+            if score > 0
+        ]
+        
+        # Keep the top results (ties stay in file order, as with a stable sort)
+        top = heapq.nlargest(max_results, scored, key=lambda item: item[1])
+        results["related"] = [
+            {
+                "file": str(file_path.relative_to(self.base_path)),
+                "relevance_score": score
+            }
+            for file_path, score in top
+        ]
         
         return results
     
+    def _file_keywords(self, file_path: Path, data: Any) -> FrozenSet[str]:
+        """Return a file's keyword set, cached until the file is reparsed."""
+        entry = self._keyword_cache.get(file_path)
+        if entry is not None and entry[0] is data:
+            return entry[1]
+        
+        keywords = frozenset(self._extract_keywords(data))
+        self._keyword_cache[file_path] = (data, keywords)
+        return keywords
+    
     def _extract_keywords(self, data: Any) -> set:
         """Extract keywords from YAML data."""
         keywords = set()
         
+        def from_dict(obj: Dict):
+            for key, value in obj.items():
+                # Handle non-string keys (e.g., integers)
+                if isinstance(key, str):
+                    keywords.add(key.casefold())
+                else:
+                    keywords.add(str(key).casefold())
+                extract_recursive(value)
+        
+        def from_list(obj: List):
+            for item in obj:
+                extract_recursive(item)
+        
+        def from_str(obj: str):
+            # Extract words from strings
+            keywords.update(_WORD_RE.findall(obj.casefold()))
+        
+        handlers = {
+            dict: from_dict,
+            list: from_list,
+            **dict.fromkeys(_SCALAR_TYPES, _ignore),
+            str: from_str,
+        }
+        
         def extract_recursive(obj: Any):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    # Handle non-string keys (e.g., integers)
-                    if isinstance(key, str):
-                        keywords.add(key.lower())
-                    else:
-                        keywords.add(str(key).lower())
-                    extract_recursive(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    extract_recursive(item)
-            elif isinstance(obj, str):
-                # Extract words from strings
-                words = re.findall(r'\w+', obj.lower())
-                keywords.update(words)
+            _dispatch(handlers, obj, _ignore)(obj)
         
         extract_recursive(data)
         return keywords
@@ -829,13 +1368,56 @@ class EnhancedDocQuery:
         if not keywords1 or not keywords2:
             return 0.0
         
-        intersection = keywords1.intersection(keywords2)
-        union = keywords1.union(keywords2)
-        
-        return len(intersection) / len(union) if union else 0.0
+        common = len(keywords1 & keywords2)
+        if not common:
+            return 0.0
+        return common / len(keywords1 | keywords2)
 
 
-def main():
+_MODES = ('text', 'key', 'file', 'related', 'task', 'path')
+
+# Options _fast_parse_args understands, by flag: (destination, takes a value)
+_CLI_OPTIONS = {
+    '--query': ('query', True), '-q': ('query', True),
+    '--mode': ('mode', True), '-m': ('mode', True),
+    '--pretty': ('pretty', False), '-p': ('pretty', False),
+    '--base-path': ('base_path', True), '-b': ('base_path', True),
+}
+
+
+def _fast_parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common, well-formed command lines without argparse.
+    
+    Returns None for anything else (help, abbreviations, attached values,
+    missing or invalid arguments) so argparse handles it with its usual
+    messages.
+    """
+    args = SimpleNamespace(query=None, mode='text', pretty=False, base_path='.')
+    i = 0
+    while i < len(argv):
+        option = _CLI_OPTIONS.get(argv[i])
+        if option is None:
+            return None
+        dest, takes_value = option
+        if takes_value:
+            if i + 1 >= len(argv) or argv[i + 1].startswith('-'):
+                return None
+            setattr(args, dest, argv[i + 1])
+            i += 2
+        else:
+            setattr(args, dest, True)
+            i += 1
+    
+    if args.query is None or args.mode not in _MODES:
+        return None
+    return args
+
+
+def _build_parser():
+    """Build the full argparse parser, only needed for help and errors."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Enhanced Document Query Tool with Predicate Support",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -869,15 +1451,18 @@ Examples:
     
     parser.add_argument('--query', '-q', required=True, help='Query string')
     parser.add_argument('--mode', '-m', 
-                       choices=['text', 'key', 'file', 'related', 'task', 'path'],
+                       choices=list(_MODES),
                        default='text',
                        help='Query mode')
     parser.add_argument('--pretty', '-p', action='store_true',
                        help='Pretty print JSON output')
     parser.add_argument('--base-path', '-b', default='.',
                        help='Base path for the project (default: current directory)')
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    args = _fast_parse_args(sys.argv[1:]) or _build_parser().parse_args()
     
     # Initialize query tool
     query_tool = EnhancedDocQuery(args.base_path)
@@ -898,9 +1483,7 @@ Examples:
     else:
         results = {"error": f"Unknown mode: {args.mode}"}
     
-    # Output results
-    indent = 2 if args.pretty else None
-    print(json.dumps(results, indent=indent, default=str))
+    write_json(results, args.pretty)
 
 
 if __name__ == "__main__":
@@ -17,103 +17,423 @@ Modes:
 """
 
 import argparse
+import bisect
+import copy
+import functools
 import json
 import os
 import re
 import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
 import yaml
 
+from yaml_db import CACHE_DIR, has_fresh_cache, parse_yaml_file
+from spec_cache import load_stamped
+from json_output import write_json
+from yaml_stream import find_key_value, iter_nodes
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+
+# Sentinel marking stack entries that were not reached through a mapping key
+_NO_KEY = object()
+
+_WALK_TYPES = (dict, list, str)
+
+_WORD_RE = re.compile(r'\w+')
+_ASCII_WORD = re.compile(r'[A-Za-z0-9_]+')
+
+# Parsed documents shared by every DocQueryTool in the process, keyed by
+# path and checked against (mtime_ns, size); least recently used drop first
+_YAML_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_YAML_CACHE_SIZE = 256
+
+_YAML_SUFFIXES = ('.yaml', '.yml')
+
+# Word indexes per file list, checked against every file's (mtime_ns, size)
+_TOKEN_INDEX_CACHE: Dict[Tuple[str, ...], Tuple[Tuple, Tuple[str, List[int], List[int], int]]] = {}
+
+# Discovered files per resolved base path, as paths relative to it, with the
+# mtime of every directory walked: adding or removing a file changes the
+# mtime of the directory holding it. Mirrored on disk for later processes.
+_DISCOVERY_CACHE: Dict[str, Dict[str, Any]] = {}
+_DISCOVERY_CACHE_FILE = CACHE_DIR.parent / 'doc_query_files.json'
+# Bumped whenever discovery changes which files it finds, retiring old entries
+_DISCOVERY_VERSION = 2
+
+
+def _walk_yaml(root: str, dirs: List[str]) -> List[str]:
+    """
+    List YAML files under root in the order Path.glob would yield them.
+    
+    Like '**', every directory is descended into, hidden ones included,
+    but symlinked ones are not followed. Every directory visited is
+    appended to dirs.
+    """
+    found = []
+    stack = [root]
+    while stack:
+        dir_path = stack.pop()
+        dirs.append(dir_path)
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(_YAML_SUFFIXES) and entry.is_file():
+                        found.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+    return found
+
+
+def _dir_mtimes(base: str, dirs: List[str]) -> Dict[str, Optional[int]]:
+    """Map each directory (relative to base) to its mtime, or None if it is missing."""
+    mtimes = {}
+    for rel_dir in dirs:
+        try:
+            mtimes[rel_dir] = os.stat(os.path.join(base, rel_dir)).st_mtime_ns
+        except OSError:
+            mtimes[rel_dir] = None
+    return mtimes
+
+
+def _load_discovery_cache() -> None:
+    """Fill _DISCOVERY_CACHE from disk, once per process."""
+    if _DISCOVERY_CACHE:
+        return
+    try:
+        with open(_DISCOVERY_CACHE_FILE, 'rb') as f:
+            _DISCOVERY_CACHE.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+
+def _save_discovery_cache() -> None:
+    """Atomically write _DISCOVERY_CACHE to disk, ignoring failures."""
+    try:
+        _DISCOVERY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = _DISCOVERY_CACHE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+        temp_path.write_text(json.dumps(_DISCOVERY_CACHE), encoding='utf-8')
+        os.replace(temp_path, _DISCOVERY_CACHE_FILE)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=4096)
+def _lower(key: str) -> str:
+    """Lowercase a mapping key; keys are interned and repeat, so this is cached."""
+    return key.lower()
+
+
+def _render_path(path: Any, chain: Optional[Tuple]) -> Any:
+    """Build a node's path string from its parent chain (see _search_text_in_dict)."""
+    steps = []
+    while chain is not None:
+        chain, step, is_index = chain
+        steps.append((step, is_index))
+    
+    for step, is_index in reversed(steps):
+        if is_index:
+            path = f"{path}[{step}]"
+        else:
+            path = f"{path}.{step}" if path else step
+    return path
+
+
+# Tool used by --jobs worker processes, built once per worker
+_WORKER_TOOL: Optional["DocQueryTool"] = None
+
+
+def _init_worker(base_path: str) -> None:
+    """Create the worker process's DocQueryTool."""
+    global _WORKER_TOOL
+    _WORKER_TOOL = DocQueryTool(base_path)
+
+
+def _scan_file(method_name: str, file_path: Path, query: str) -> Any:
+    """Run one per-file scan method in a worker process."""
+    return getattr(_WORKER_TOOL, method_name)(file_path, query)
+
+
+def _flatten_text(data: Any) -> Tuple[List[str], List[Tuple]]:
+    """
+    Flatten a document into the texts _search_text_in_dict would match.
+    
+    Returns:
+        Tuple of (lowercased texts, (type, chain, key, node) per text), in
+        the order _search_text_in_dict reports hits: each mapping key's
+        text, then the string value under it
+    """
+    texts = []
+    entries = []
+    stack = [(data, None, _NO_KEY)]
+    
+    while stack:
+        node, chain, key = stack.pop()
+        
+        if key is not _NO_KEY:
+            texts.append(_lower(key) if type(key) is str else str(key).lower())
+            entries.append(("key", chain, key, node))
+        
+        node_type = type(node)
+        if node_type not in _WALK_TYPES:
+            node_type = next((t for t in _WALK_TYPES if isinstance(node, t)), node_type)
+        
+        if node_type is dict:
+            stack.extend(
+                (value, (chain, child, False), child)
+                for child, value in reversed(node.items())
+            )
+        elif node_type is list:
+            stack.extend(
+                (node[i], (chain, i, True), _NO_KEY)
+                for i in range(len(node) - 1, -1, -1)
+            )
+        elif node_type is str:
+            texts.append(node.lower())
+            entries.append(("value", chain, key, node))
+    
+    return texts, entries
+
 
 class DocQueryTool:
     """Tool for querying project documentation and specifications."""
     
-    def __init__(self, base_path: str = "."):
-        """Initialize the tool with the project base path."""
+    def __init__(self, base_path: str = ".", jobs: int = 1):
+        """
+        Initialize the tool with the project base path.
+        
+        Args:
+            base_path: Project root to search
+            jobs: Number of processes used to load and scan files
+        """
         self.base_path = Path(base_path)
+        self.jobs = jobs
         self.spec_dirs = ["spec", "log", "man"]
         self.yaml_files = []
+        # Each file's path relative to base_path, as reported in results
+        self._rel_paths: Dict[Path, str] = {}
+        # Text hits per (file, query), shared by search_text and find_related
+        self._hit_cache: Dict[Tuple[Path, str], List[Dict]] = {}
+        self._token_index: Optional[Tuple[str, List[int], List[int], int]] = None
+        # Flattened texts per file, with the cached document they came from
+        self._flat_cache: Dict[Path, Tuple[Any, Tuple[List[str], List[Tuple]]]] = {}
+        self._primed = False
         self._discover_files()
     
     def _discover_files(self):
         """Discover all YAML files in relevant directories."""
-        for dir_name in self.spec_dirs:
-            dir_path = self.base_path / dir_name
-            if dir_path.exists():
-                self.yaml_files.extend(dir_path.glob("**/*.yaml"))
-                self.yaml_files.extend(dir_path.glob("**/*.yml"))
-        
-        # Also check for YAML files in root directory
-        for yaml_file in self.base_path.glob("*.yaml"):
-            if yaml_file.is_file():
-                self.yaml_files.append(yaml_file)
-        for yaml_file in self.base_path.glob("*.yml"):
-            if yaml_file.is_file():
-                self.yaml_files.append(yaml_file)
+        base = str(self.base_path)
+        cache_key = str(self.base_path.resolve())
+        _load_discovery_cache()
+        cached = _DISCOVERY_CACHE.get(cache_key)
+        if (cached is None or cached.get('version') != _DISCOVERY_VERSION
+                or _dir_mtimes(base, list(cached['mtimes'])) != cached['mtimes']):
+            walked = ['.']
+            files = []
+            for dir_name in self.spec_dirs:
+                if os.path.isdir(os.path.join(base, dir_name)):
+                    dirs = []
+                    found = _walk_yaml(os.path.join(base, dir_name), dirs)
+                    walked.extend(os.path.relpath(d, base) for d in dirs)
+                    # .yaml before .yml, as the two globs used to return them
+                    files.extend(f for f in found if f.endswith('.yaml'))
+                    files.extend(f for f in found if f.endswith('.yml'))
+            
+            # Also check for YAML files in root directory
+            with os.scandir(base) as entries:
+                root_files = [e.path for e in entries if e.name.endswith(_YAML_SUFFIXES) and e.is_file()]
+            files.extend(f for f in root_files if f.endswith('.yaml'))
+            files.extend(f for f in root_files if f.endswith('.yml'))
+            
+            cached = {
+                'version': _DISCOVERY_VERSION,
+                'mtimes': _dir_mtimes(base, walked),
+                'files': [os.path.relpath(f, base) for f in files],
+            }
+            _DISCOVERY_CACHE[cache_key] = cached
+            _save_discovery_cache()
+        
+        for rel_path in cached['files']:
+            file_path = self.base_path / rel_path
+            self.yaml_files.append(file_path)
+            self._rel_paths[file_path] = str(Path(rel_path))
+    
+    def _prime_from_spec_cache(self):
+        """
+        Seed the document cache with the spec tree from spec_cache, once.
+        
+        Only worth it when every document is about to be loaded: a fresh
+        process then reads one pickle instead of parsing (or reading the
+        JSON cache of) every spec file. Entries keep the stamp they were
+        parsed at, so a file changed since is still reloaded.
+        """
+        if self._primed:
+            return
+        self._primed = True
+        corpus = load_stamped(self.base_path)
+        for file_path in self.yaml_files:
+            entry = corpus.get(self._rel_paths[file_path])
+            key = str(file_path)
+            if entry is not None and key not in _YAML_CACHE:
+                _YAML_CACHE[key] = entry
+        while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
     
     def _load_yaml_safe(self, file_path: Path) -> Optional[Dict]:
-        """Safely load a YAML file, returning None on error."""
+        """
+        Safely load a YAML file, returning None on error.
+        
+        Parsed documents are kept in a process-wide LRU cache and reused while
+        the file's mtime and size are unchanged. Callers get a deep copy, so
+        mutating a result never corrupts the cache.
+        """
+        data = self._load_yaml_shared(file_path)
+        return None if data is None else copy.deepcopy(data)
+    
+    def _load_yaml_shared(self, file_path: Path) -> Optional[Dict]:
+        """Like _load_yaml_safe, but return the cached document itself; never mutate it."""
+        key = str(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            stat = os.stat(file_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = _YAML_CACHE.get(key)
+            if cached is not None and cached[0] == stamp:
+                _YAML_CACHE.move_to_end(key)
+                return cached[1]
+            
+            data = parse_yaml_file(file_path)
         except Exception as e:
             print(f"Warning: Could not load {file_path}: {e}", file=sys.stderr)
             return None
+        
+        _YAML_CACHE[key] = (stamp, data)
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+        return data
     
-    def _search_text_in_dict(self, data: Any, query: str, path: str = "") -> List[Dict]:
-        """Recursively search for text in nested dictionary/list structures."""
-        results = []
+    def _build_text_matcher(self, query: str, keys: bool = False) -> Callable[[str], Any]:
+        """
+        Build a case-insensitive substring matcher for the query (or for keys).
+        
+        Lowercasing the text and using str.find measures faster than a
+        re.IGNORECASE search for every query length on these documents.
+        A query made only of ASCII non-letters (such as a task ID) is not
+        affected by lowercasing, so it skips the lowered copy altogether.
+        """
+        if query.isascii() and not any(char.isalpha() for char in query):
+            return lambda text: query in text
+        
         query_lower = query.lower()
+        lower = _lower if keys else str.lower
+        return lambda text: query_lower in lower(text)
+    
+    def _search_text_in_dict(self, data: Any, match: Callable[[str], Any], path: str = "",
+                             match_key: Optional[Callable[[str], Any]] = None) -> List[Dict]:
+        """Search for text in nested dictionary/list structures in a single pass."""
+        results = []
+        match_key = match_key or match
+        # Entries are (node, chain, key); key is _NO_KEY for list items and the root.
+        # chain links (parent chain, key or index, is_index) back to the root, so
+        # path strings are only built for hits.
+        # Children are pushed in reverse so hits come out in document order.
+        stack = [(data, None, _NO_KEY)]
         
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                
-                # Check if key matches
-                if query_lower in key.lower():
-                    results.append({
-                        "path": current_path,
-                        "type": "key",
-                        "content": {key: value}
-                    })
-                
-                # Recurse into value
-                results.extend(self._search_text_in_dict(value, query, current_path))
-        
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]"
-                results.extend(self._search_text_in_dict(item, query, current_path))
-        
-        elif isinstance(data, str):
-            # Check if text content matches
-            if query_lower in data.lower():
+        while stack:
+            node, chain, key = stack.pop()
+            
+            # Check if key matches
+            if key is not _NO_KEY and match_key(key if type(key) is str else str(key)):
                 results.append({
-                    "path": path,
-                    "type": "value",
-                    "content": data
+                    "path": _render_path(path, chain),
+                    "type": "key",
+                    "content": {key: node}
                 })
+            
+            node_type = type(node)
+            if node_type not in _WALK_TYPES:
+                # SafeLoader never builds subclasses, so this is the rare path
+                node_type = next((t for t in _WALK_TYPES if isinstance(node, t)), node_type)
+            
+            if node_type is dict:
+                stack.extend(
+                    (value, (chain, child, False), child)
+                    for child, value in reversed(node.items())
+                )
+            elif node_type is list:
+                stack.extend(
+                    (node[i], (chain, i, True), _NO_KEY)
+                    for i in range(len(node) - 1, -1, -1)
+                )
+            elif node_type is str:
+                # Check if text content matches
+                if match(node):
+                    results.append({
+                        "path": _render_path(path, chain),
+                        "type": "value",
+                        "content": node
+                    })
         
         return results
     
+    def _file_hits(self, file_path: Path, data: Any, query: str) -> List[Dict]:
+        """
+        Get a file's key/value hits for a query, as _search_text_in_dict would.
+        
+        data must be the shared cached document: its lowercased texts are
+        flattened once and reused by every query, so a search is a single
+        substring test per text. Hit contents are copied out of it.
+        """
+        cache_key = (file_path, query)
+        hits = self._hit_cache.get(cache_key)
+        if hits is not None:
+            return hits
+        
+        cached = self._flat_cache.get(file_path)
+        if cached is None or cached[0] is not data:
+            cached = self._flat_cache[file_path] = (data, _flatten_text(data))
+        texts, entries = cached[1]
+        
+        # Lowercasing never changes ASCII non-letters, so the lowered query
+        # matches exactly what _build_text_matcher would
+        query_lower = query.lower()
+        hits = []
+        for idx in [i for i, text in enumerate(texts) if query_lower in text]:
+            hit_type, chain, key, node = entries[idx]
+            hits.append({
+                "path": _render_path("", chain),
+                "type": hit_type,
+                "content": copy.deepcopy({key: node} if hit_type == "key" else node)
+            })
+        
+        self._hit_cache[cache_key] = hits
+        return hits
+    
     def search_text(self, query: str) -> Dict[str, Any]:
         """Search for text content across all YAML files."""
-        all_results = {}
+        all_results = []
         
-        for file_path in self.yaml_files:
-            data = self._load_yaml_safe(file_path)
-            if data is None:
-                continue
-            
-            matches = self._search_text_in_dict(data, query)
+        for file_path, matches in zip(self.yaml_files, self._text_hits_for(self.yaml_files, query)):
             if matches:
-                rel_path = str(file_path.relative_to(self.base_path))
-                all_results[rel_path] = {
-                    "file": rel_path,
+                all_results.append({
+                    "file": self._rel_paths[file_path],
                     "matches": matches,
                     "match_count": len(matches)
-                }
+                })
         
         return {
             "query": query,
@@ -122,24 +442,124 @@ class DocQueryTool:
             "results": all_results
         }
     
+    def _map_files(self, method: Callable[[Path, str], Any], files: List[Path], query: str) -> List[Any]:
+        """
+        Apply a per-file scan method to files, in worker processes if jobs > 1.
+        
+        Workers load files through the shared on-disk JSON cache, so only
+        the first process to see a changed file parses its YAML.
+        """
+        if self.jobs <= 1 or len(files) < 2:
+            return [method(file_path, query) for file_path in files]
+        
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                 initargs=(str(self.base_path),)) as pool:
+            return list(pool.map(_scan_file, repeat(method.__name__), files, repeat(query), chunksize=8))
+    
+    def _should_stream(self, file_path: Path) -> bool:
+        """Check whether a file would have to be parsed from YAML to be loaded."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        cached = _YAML_CACHE.get(str(file_path))
+        if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return False
+        return not has_fresh_cache(file_path)
+    
+    def _stream_file(self, file_path: Path, scan: Callable[[Any], Any]) -> Any:
+        """Run a scan over a file's YAML event stream."""
+        with open(file_path, 'rb') as f:
+            loader = _Loader(f)
+            try:
+                return scan(loader)
+            finally:
+                loader.dispose()
+    
+    def _stream_text_hits(self, loader: Any, match: Callable[[str], Any],
+                          match_key: Callable[[str], Any]) -> List[Dict]:
+        """
+        Find the same hits as _search_text_in_dict straight from the event stream.
+        
+        Only subtrees under a matching key are constructed, since their hit
+        reports the whole value.
+        """
+        results = []
+        for path, key, value, key_hit, is_leaf in iter_nodes(loader, match_key):
+            if key_hit:
+                results.append({"path": path, "type": "key", "content": {key: value}})
+            if is_leaf and type(value) is str and match(value):
+                results.append({"path": path, "type": "value", "content": value})
+        return results
+    
+    def _scan_text(self, file_path: Path, query: str) -> Optional[List[Dict]]:
+        """
+        Get a file's text hits, or None if it cannot be loaded.
+        
+        Files that are not cached in any form are searched from the YAML
+        event stream without building the document; anything the stream
+        scan does not handle (or any error) falls back to a full load.
+        """
+        hits = self._hit_cache.get((file_path, query))
+        if hits is not None:
+            return hits
+        
+        if self._should_stream(file_path):
+            match = self._build_text_matcher(query)
+            match_key = self._build_text_matcher(query, keys=True)
+            try:
+                hits = self._stream_file(
+                    file_path, lambda loader: self._stream_text_hits(loader, match, match_key)
+                )
+            except Exception:
+                pass
+            else:
+                self._hit_cache[(file_path, query)] = hits
+                return hits
+        
+        data = self._load_yaml_shared(file_path)
+        if data is None:
+            return None
+        return self._file_hits(file_path, data, query)
+    
+    def _text_hits_for(self, files: List[Path], query: str) -> List[Optional[List[Dict]]]:
+        """Get the text hits of each file (None if unloadable), reusing earlier walks."""
+        pending = [file_path for file_path in files if (file_path, query) not in self._hit_cache]
+        if len(pending) < len(files) or self.jobs <= 1:
+            # Cached or serial: _scan_text fills _hit_cache as it goes
+            return [self._scan_text(file_path, query) for file_path in files]
+        
+        hits_list = self._map_files(self._scan_text, files, query)
+        for file_path, hits in zip(files, hits_list):
+            if hits is not None:
+                self._hit_cache[(file_path, query)] = hits
+        return hits_list
+    
+    def _scan_key(self, file_path: Path, key_path: str) -> Optional[Any]:
+        """Get the value at key_path in a file, or None if absent or unloadable."""
+        if self._should_stream(file_path):
+            parts = key_path.split('.')
+            try:
+                return self._stream_file(file_path, lambda loader: find_key_value(loader, parts))
+            except Exception:
+                pass
+        
+        data = self._load_yaml_safe(file_path)
+        if data is None:
+            return None
+        return self._get_nested_value(data, key_path)
+    
     def search_key(self, key_path: str) -> Dict[str, Any]:
         """Search for specific YAML key paths."""
-        all_results = {}
+        all_results = []
         
-        for file_path in self.yaml_files:
-            data = self._load_yaml_safe(file_path)
-            if data is None:
-                continue
-            
-            # Try to navigate to the key path
-            value = self._get_nested_value(data, key_path)
+        for file_path, value in zip(self.yaml_files, self._map_files(self._scan_key, self.yaml_files, key_path)):
             if value is not None:
-                rel_path = str(file_path.relative_to(self.base_path))
-                all_results[rel_path] = {
-                    "file": rel_path,
+                all_results.append({
+                    "file": self._rel_paths[file_path],
                     "key_path": key_path,
                     "value": value
-                }
+                })
         
         return {
             "query": key_path,
@@ -150,7 +570,8 @@ class DocQueryTool:
     
     def _get_nested_value(self, data: Any, path: str) -> Optional[Any]:
         """Get value from nested dictionary using dot notation."""
-        parts = path.split('.')
+        # Interned parts compare by identity against the interned keys
+        parts = [sys.intern(part) for part in path.split('.')]
         current = data
         
         for part in parts:
@@ -163,17 +584,17 @@ class DocQueryTool:
     
     def get_file_content(self, file_pattern: str) -> Dict[str, Any]:
         """Retrieve full content of files matching pattern."""
-        results = {}
+        results = []
         
         for file_path in self.yaml_files:
-            rel_path = str(file_path.relative_to(self.base_path))
+            rel_path = self._rel_paths[file_path]
             if file_pattern in rel_path:
                 data = self._load_yaml_safe(file_path)
                 if data is not None:
-                    results[rel_path] = {
+                    results.append({
                         "file": rel_path,
                         "content": data
-                    }
+                    })
         
         return {
             "query": file_pattern,
@@ -185,20 +606,30 @@ class DocQueryTool:
     def find_related(self, topic: str) -> Dict[str, Any]:
         """Find files related to a topic with relevance scoring."""
         scored_files = []
+        topic_lower = topic.lower()
+        candidates = self._candidate_files(topic)
         
-        for file_path in self.yaml_files:
-            data = self._load_yaml_safe(file_path)
-            if data is None:
+        # Files the token index rules out can still match on their name
+        files = [
+            file_path for idx, file_path in enumerate(self.yaml_files)
+            if candidates is None or (candidates >> idx) & 1
+            or topic_lower in str(file_path).lower()
+        ]
+        
+        # Score from the same walk search_text uses
+        for file_path, hits in zip(files, self._text_hits_for(files, topic)):
+            if hits is None:
                 continue
             
-            # Calculate relevance score
-            score = self._calculate_relevance(data, topic, file_path)
+            score = self._calculate_relevance(hits, topic, file_path)
             if score > 0:
-                rel_path = str(file_path.relative_to(self.base_path))
+                rel_path = self._rel_paths[file_path]
+                # Only a file-name match needs the document itself for its preview
+                data = None if hits else self._load_yaml_safe(file_path)
                 scored_files.append({
                     "file": rel_path,
                     "relevance_score": score,
-                    "preview": self._get_preview(data, topic)
+                    "preview": self._get_preview(data, hits)
                 })
         
         # Sort by relevance score
@@ -211,8 +642,111 @@ class DocQueryTool:
             "results": scored_files
         }
     
-    def _calculate_relevance(self, data: Any, topic: str, file_path: Path) -> int:
-        """Calculate relevance score for a file based on topic."""
+    def _file_stamps(self) -> Tuple:
+        """Get every file's (mtime_ns, size), or None for missing files."""
+        stamps = []
+        for file_path in self.yaml_files:
+            try:
+                stat = os.stat(file_path)
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+    
+    def _token_bitsets(self) -> Tuple[str, List[int], List[int], int]:
+        """
+        Index the words of every file's keys and string values as bitsets.
+        
+        The index is stored column-wise and shared by every tool with the
+        same files until one of them changes.
+        
+        Returns:
+            Tuple of (sorted lowercased ASCII words joined by newlines, start
+            offset of each word in that string, bitset of file indices for
+            each word, bitset of files that also contain non-ASCII words)
+        """
+        if self._token_index is not None:
+            return self._token_index
+        
+        cache_key = tuple(map(str, self.yaml_files))
+        stamps = self._file_stamps()
+        cached = _TOKEN_INDEX_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamps:
+            self._token_index = cached[1]
+            return self._token_index
+        
+        # Every document is walked, so load the spec tree in one go
+        self._prime_from_spec_cache()
+        index: Dict[str, int] = {}
+        unicode_files = 0
+        for idx, file_path in enumerate(self.yaml_files):
+            # Read-only walk, so the cached document needs no copy
+            data = self._load_yaml_shared(file_path)
+            if data is None:
+                continue
+            
+            tokens = set()
+            stack = [data]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    for key, value in node.items():
+                        tokens.update(_WORD_RE.findall(str(key)))
+                        stack.append(value)
+                elif isinstance(node, list):
+                    stack.extend(node)
+                elif isinstance(node, str):
+                    tokens.update(_WORD_RE.findall(node))
+            
+            bit = 1 << idx
+            for token in tokens:
+                if token.isascii():
+                    token = token.lower()
+                    index[token] = index.get(token, 0) | bit
+                else:
+                    unicode_files |= bit
+        
+        words = sorted(index)
+        starts = []
+        offset = 0
+        for word in words:
+            starts.append(offset)
+            offset += len(word) + 1
+        
+        self._token_index = ('\n'.join(words), starts, [index[word] for word in words], unicode_files)
+        _TOKEN_INDEX_CACHE[cache_key] = (stamps, self._token_index)
+        return self._token_index
+    
+    def _candidate_files(self, topic: str) -> Optional[int]:
+        """
+        Get the bitset of files whose text can contain topic, or None if unknown.
+        
+        Only single ASCII words are indexed: any case-insensitive match of
+        one lies inside a single word of the text, which is either an ASCII
+        word containing it once lowercased, or a non-ASCII word.
+        """
+        if not _ASCII_WORD.fullmatch(topic):
+            return None
+        
+        words, starts, files, candidates = self._token_bitsets()
+        topic_lower = topic.lower()
+        # One substring scan over all words; a topic never spans the newlines
+        pos = words.find(topic_lower)
+        while pos != -1:
+            word_idx = bisect.bisect_right(starts, pos) - 1
+            candidates |= files[word_idx]
+            if word_idx + 1 == len(starts):
+                break
+            pos = words.find(topic_lower, starts[word_idx + 1])
+        return candidates
+    
+    def _calculate_relevance(self, hits: List[Dict], topic: str, file_path: Path) -> int:
+        """
+        Calculate relevance score for a file based on topic.
+        
+        Every occurrence of the topic in a matching key or string value
+        scores 2, and a topic in the file name adds 10.
+        """
         score = 0
         topic_lower = topic.lower()
         
@@ -220,34 +754,27 @@ class DocQueryTool:
         if topic_lower in str(file_path).lower():
             score += 10
         
-        # Convert data to string and count occurrences
-        data_str = json.dumps(data, default=str).lower()
-        score += data_str.count(topic_lower) * 2
+        # Count occurrences in the hit texts instead of a serialized copy
+        for hit in hits:
+            text = hit["content"] if hit["type"] == "value" else str(next(iter(hit["content"])))
+            score += max(1, text.lower().count(topic_lower)) * 2
         
         return score
     
-    def _get_preview(self, data: Any, topic: str, max_length: int = 200) -> str:
+    def _get_preview(self, data: Any, hits: List[Dict], max_length: int = 200) -> str:
         """Get a preview of content related to the topic."""
-        data_str = json.dumps(data, indent=2, default=str)
-        topic_lower = topic.lower()
-        data_lower = data_str.lower()
-        
-        # Find first occurrence
-        idx = data_lower.find(topic_lower)
-        if idx == -1:
-            return data_str[:max_length] + "..."
+        # Prefer the first matching value, then the first matching key
+        hit = next((hit for hit in hits if hit["type"] == "value"), None)
+        if hit is not None:
+            return f"{hit['path']}: {hit['content'][:max_length]}"
+        if hits:
+            return str(hits[0]["path"])[:max_length]
         
-        # Get context around the match
-        start = max(0, idx - 50)
-        end = min(len(data_str), idx + max_length)
-        preview = data_str[start:end]
-        
-        if start > 0:
-            preview = "..." + preview
-        if end < len(data_str):
-            preview = preview + "..."
-        
-        return preview
+        # Only the file name matched; show the start of the document
+        text = json.dumps(data, indent=2, default=str)
+        if len(text) > max_length:
+            return text[:max_length] + "..."
+        return text
 
 
 def main():
@@ -276,11 +803,17 @@ def main():
         action="store_true",
         help="Pretty print JSON output"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of processes used to scan files (default: 1)"
+    )
     
     args = parser.parse_args()
     
     # Initialize tool
-    tool = DocQueryTool(args.base_path)
+    tool = DocQueryTool(args.base_path, jobs=args.jobs)
     
     # Execute query based on mode
     if args.mode == "text":
@@ -292,11 +825,7 @@ def main():
     elif args.mode == "related":
         results = tool.find_related(args.query)
     
-    # Output results
-    if args.pretty:
-        print(json.dumps(results, indent=2, default=str))
-    else:
-        print(json.dumps(results, default=str))
+    write_json(results, args.pretty)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+JSON Output Module
+
+Writes query results to stdout as JSON for the doc_query tools. orjson is
+used when it is installed; its output decodes to the same values the json
+module would write.
+
+Usage:
+    from json_output import write_json
+    write_json(results, pretty=True)
+"""
+
+import json
+import math
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional; output falls back to json
+    orjson = None
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data holds a NaN or infinite float, as a key or value."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, float):
+            if not math.isfinite(node):
+                return True
+        elif isinstance(node, dict):
+            stack.extend(node)
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return False
+
+
+def _orjson_payload(results: Any, pretty: bool) -> Any:
+    """Serialize results with orjson, or return None where json must be used."""
+    # Dates and times go through default=str like they do with json,
+    # rather than orjson's own RFC 3339 form
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    try:
+        payload = orjson.dumps(results, default=str, option=option)
+    except TypeError:
+        # Things orjson rejects, such as integers beyond 64 bits
+        return None
+
+    # orjson writes NaN and infinities as null where json writes NaN and
+    # Infinity; only a payload with a null can be hiding one
+    if b"null" in payload and _has_non_finite(results):
+        return None
+    return payload
+
+
+def write_json(results: Any, pretty: bool) -> None:
+    """Write results to stdout as JSON, using orjson when it is installed."""
+    if orjson is not None and hasattr(sys.stdout, 'buffer'):
+        payload = _orjson_payload(results, pretty)
+        if payload is not None:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(payload + b"\n")
+            sys.stdout.buffer.flush()
+            return
+
+    # Streamed straight to stdout instead of building one big string
+    json.dump(results, sys.stdout, indent=2 if pretty else None, default=str)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
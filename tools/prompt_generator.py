@@ -19,17 +19,76 @@ Usage:
     python3 tools/prompt_generator.py --all-phase 1
 """
 
-import argparse
+import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import yaml
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from yaml_db import YAMLDatabase
 from task_manager import TaskManager
+from spec_cache import load_all
+
+
+# Fixed parts of every prompt
+_RELATED_SPECS_COMMANDS = """# Get domain entities
+python3 tools/doc_query.py --query "spec/domain.yaml" --mode file --pretty
+
+# Get API specifications
+python3 tools/doc_query.py --query "spec/apis.yaml" --mode file --pretty
+```
+"""
+
+_CODEGEN_OUTPUT_DIRS = {
+    'backend_node': 'backend/src',
+    'git_integration': 'backend/src',
+    'logging_and_metrics': 'backend/src',
+    'backend_python_tools': 'backend_python/src',
+    'frontend_svelte': 'frontend/src/lib',
+}
+
+_IMPLEMENTATION_STEPS = """## Implementation Steps
+
+1. **Generate Code Scaffolding**
+   - Run the code generator to create function signatures
+   - Review generated code structure and comments
+
+2. **Implement Functions**
+   - Follow the algorithm steps in each function spec
+   - Implement precondition validation first
+   - Handle all error cases from the spec
+   - Ensure postconditions are satisfied
+
+3. **Add Tests**
+   - Create unit tests for each function
+   - Test error cases and edge conditions
+   - Verify contract compliance
+
+4. **Integration**
+   - Wire up API routes if applicable
+   - Test end-to-end flow
+"""
+
+_DEFAULT_VERIFICATION = """- [ ] All functions implemented according to spec
+- [ ] Unit tests pass
+- [ ] Integration tests pass
+- [ ] Code follows project style guidelines"""
+
+_COMPLETION_CHECKLIST = """## Completion Checklist
+
+- [ ] All focus areas addressed
+- [ ] All functions implemented
+- [ ] Tests written and passing
+- [ ] Code reviewed against spec
+- [ ] Documentation updated if needed
+
+## Task Cleanup
+
+After completing the task:
+```bash"""
 
 
 class PromptGenerator:
@@ -40,6 +99,10 @@ class PromptGenerator:
         self.task_manager = TaskManager(project_root)
         self.prompts_dir = self.project_root / "prompts" / "dev"
         self.prompts_dir.mkdir(parents=True, exist_ok=True)
+        # Specs parsed so far, shared by every prompt this generator builds
+        self._module_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._func_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._spec_corpus: Optional[Dict[str, Any]] = None
     
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task from master_todo.yaml."""
@@ -50,34 +113,51 @@ class PromptGenerator:
         return None
     
     def load_module_spec(self, module_id: str) -> Optional[Dict[str, Any]]:
-        """Load module specification."""
-        spec_path = self.project_root / "spec" / "modules" / f"{module_id}.yaml"
-        if spec_path.exists():
-            db = YAMLDatabase(spec_path, create_backup=False)
-            return db.load()
-        return None
+        """Load module specification (cached per generator; treat as read-only)."""
+        if module_id not in self._module_cache:
+            spec_path = self.project_root / "spec" / "modules" / f"{module_id}.yaml"
+            self._module_cache[module_id] = self._load_spec(spec_path)
+        return self._module_cache[module_id]
     
     def load_function_spec(self, func_path: str) -> Optional[Dict[str, Any]]:
         """Load function specification from path like 'backend_node/create_project.yaml'."""
-        spec_path = self.project_root / "spec" / "functions" / func_path
-        if spec_path.exists():
-            db = YAMLDatabase(spec_path, create_backup=False)
-            return db.load()
-        return None
+        if func_path not in self._func_cache:
+            spec_path = self.project_root / "spec" / "functions" / func_path
+            self._func_cache[func_path] = self._load_spec(spec_path)
+        return self._func_cache[func_path]
+    
+    def _load_spec(self, spec_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a spec file, or None if it doesn't exist."""
+        if not spec_path.exists():
+            return None
+        
+        # The whole spec tree comes from one shared cache file
+        if self._spec_corpus is None:
+            self._spec_corpus = load_all(self.project_root)
+        rel_path = os.path.relpath(spec_path, self.project_root)
+        if rel_path in self._spec_corpus:
+            data = self._spec_corpus[rel_path]
+            return data if data is not None else {}
+        
+        db = YAMLDatabase(spec_path, create_backup=False)
+        return db.load()
     
-    def generate_prompt(self, task_id: str) -> Optional[str]:
-        """Generate a detailed prompt for a task."""
-        task = self.get_task(task_id)
+    def clear_spec_cache(self) -> None:
+        """Forget loaded specs so they are read from disk again."""
+        self._module_cache.clear()
+        self._func_cache.clear()
+        self._spec_corpus = None
+    
+    def generate_prompt(self, task_id: str, task: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Generate a detailed prompt for a task (looked up by ID unless given)."""
+        if task is None:
+            task = self.get_task(task_id)
         if not task:
             print(f"Error: Task {task_id} not found")
             return None
         
-        task_name = task.get('name', 'Unknown Task')
-        task_goal = task.get('goal', '')
         details = task.get('details', {})
-        focus_areas = details.get('focus', [])
         functions = details.get('functions', [])
-        verification = details.get('verification', [])
         
         # Determine modules involved
         modules = set()
@@ -85,120 +165,97 @@ class PromptGenerator:
             module_id = func_path.split('/')[0]
             modules.add(module_id)
         
-        # Build prompt
-        lines = []
-        
-        # Header
-        lines.append(f"# Prompt {task_id}: {task_name}")
-        lines.append("")
-        lines.append("## Task Description")
-        lines.append(task_goal)
-        lines.append("")
-        
-        # Context Gathering
-        lines.append("## Context Gathering")
-        lines.append("Before starting, gather context using the doc_query tool:")
-        lines.append("")
-        lines.append("```bash")
+        # Each section is rendered as one string, ending with its blank line
+        sections = [
+            self._render_header(task_id, task),
+            self._render_context(modules, functions),
+            self._render_codegen(modules),
+            self._render_requirements(details.get('focus', []), functions, modules),
+            _IMPLEMENTATION_STEPS,
+            self._render_verification(details.get('verification', [])),
+            self._render_completion(task_id),
+        ]
+        return '\n'.join(sections)
+    
+    def _render_header(self, task_id: str, task: Dict[str, Any]) -> str:
+        """Render the title and task description."""
+        return '\n'.join([
+            f"# Prompt {task_id}: {task.get('name', 'Unknown Task')}",
+            "",
+            "## Task Description",
+            task.get('goal', ''),
+            "",
+        ])
+    
+    def _render_context(self, modules: set, functions: List[str]) -> str:
+        """Render the doc_query commands for gathering context."""
+        lines = [
+            "## Context Gathering",
+            "Before starting, gather context using the doc_query tool:",
+            "",
+            "```bash",
+        ]
         
         # Module specs
         for module_id in modules:
-            lines.append(f"# Get {module_id} module specification")
-            lines.append(f'python3 tools/doc_query.py --query "spec/modules/{module_id}.yaml" --mode file --pretty')
-            lines.append("")
+            lines += [
+                f"# Get {module_id} module specification",
+                f'python3 tools/doc_query.py --query "spec/modules/{module_id}.yaml" --mode file --pretty',
+                "",
+            ]
         
         # Function specs
         for func_path in functions:
             func_name = func_path.split('/')[-1].replace('.yaml', '')
-            lines.append(f"# Get {func_name} function specification")
-            lines.append(f'python3 tools/doc_query.py --query "spec/functions/{func_path}" --mode file --pretty')
-            lines.append("")
+            lines += [
+                f"# Get {func_name} function specification",
+                f'python3 tools/doc_query.py --query "spec/functions/{func_path}" --mode file --pretty',
+                "",
+            ]
         
         # Related specs
-        lines.append("# Get domain entities")
-        lines.append('python3 tools/doc_query.py --query "spec/domain.yaml" --mode file --pretty')
-        lines.append("")
-        lines.append("# Get API specifications")
-        lines.append('python3 tools/doc_query.py --query "spec/apis.yaml" --mode file --pretty')
-        lines.append("```")
-        lines.append("")
-        
-        # Code Generation
-        lines.append("## Code Generation")
-        lines.append("Use the code generator to create scaffolding:")
-        lines.append("")
-        lines.append("```bash")
+        lines.append(_RELATED_SPECS_COMMANDS)
+        return '\n'.join(lines)
+    
+    def _render_codegen(self, modules: set) -> str:
+        """Render the code generator commands."""
+        lines = [
+            "## Code Generation",
+            "Use the code generator to create scaffolding:",
+            "",
+            "```bash",
+        ]
         for module_id in modules:
-            lines.append(f"# Generate {module_id} module scaffolding")
-            lines.append(f"python3 tools/code_generator.py --module {module_id} --preview")
-            lines.append("")
+            lines += [
+                f"# Generate {module_id} module scaffolding",
+                f"python3 tools/code_generator.py --module {module_id} --preview",
+                "",
+            ]
         lines.append("# Or generate to files:")
         for module_id in modules:
-            if module_id in ['backend_node', 'git_integration', 'logging_and_metrics']:
-                lines.append(f"python3 tools/code_generator.py --module {module_id} --output backend/src")
-            elif module_id == 'backend_python_tools':
-                lines.append(f"python3 tools/code_generator.py --module {module_id} --output backend_python/src")
-            elif module_id == 'frontend_svelte':
-                lines.append(f"python3 tools/code_generator.py --module {module_id} --output frontend/src/lib")
-        lines.append("```")
-        lines.append("")
-        
-        # Requirements
-        lines.append("## Requirements")
-        lines.append("")
+            output_dir = _CODEGEN_OUTPUT_DIRS.get(module_id)
+            if output_dir:
+                lines.append(f"python3 tools/code_generator.py --module {module_id} --output {output_dir}")
+        lines += ["```", ""]
+        return '\n'.join(lines)
+    
+    def _render_requirements(self, focus_areas: List[str], functions: List[str], modules: set) -> str:
+        """Render focus areas, function details and module dependencies."""
+        lines = ["## Requirements", ""]
         
         # Focus areas
         if focus_areas:
             lines.append("### Focus Areas")
-            for area in focus_areas:
-                lines.append(f"- {area}")
+            lines.extend(f"- {area}" for area in focus_areas)
             lines.append("")
         
         # Function details
         if functions:
-            lines.append("### Functions to Implement")
-            lines.append("")
+            lines += ["### Functions to Implement", ""]
             for func_path in functions:
                 func_spec = self.load_function_spec(func_path)
                 if func_spec:
-                    func = func_spec.get('function', {})
-                    func_name = func.get('name', 'unknown')
-                    func_purpose = func.get('purpose', '').strip().split('\n')[0]
-                    
-                    lines.append(f"#### {func_name}")
-                    lines.append(f"- **Purpose**: {func_purpose}")
-                    
-                    # Signature
-                    sig = func.get('signature', {})
-                    params = sig.get('parameters', [])
-                    if params:
-                        param_strs = []
-                        for p in params:
-                            p_name = p.get('name', 'arg')
-                            p_type = p.get('type', 'any')
-                            param_strs.append(f"{p_name}: {p_type}")
-                        lines.append(f"- **Signature**: `{func_name}({', '.join(param_strs)})`")
-                    
-                    returns = sig.get('returns', {})
-                    if returns:
-                        lines.append(f"- **Returns**: `{returns.get('type', 'void')}` - {returns.get('description', '')}")
-                    
-                    # Contract
-                    contract = func.get('contract', {})
-                    preconditions = contract.get('preconditions', [])
-                    if preconditions:
-                        lines.append("- **Preconditions**:")
-                        for pre in preconditions[:3]:  # Limit to first 3
-                            lines.append(f"  - {pre}")
-                    
-                    postconditions = contract.get('postconditions', [])
-                    if postconditions:
-                        lines.append("- **Postconditions**:")
-                        for post in postconditions[:3]:  # Limit to first 3
-                            lines.append(f"  - {post}")
-                    
-                    lines.append(f"- **Spec**: `spec/functions/{func_path}`")
-                    lines.append("")
+                    lines.append(self._render_function(func_path, func_spec.get('function', {})))
         
         # Module dependencies
         if modules:
@@ -220,112 +277,168 @@ class PromptGenerator:
                                 lines.append(f"- `{dep}`")
             lines.append("")
         
-        # Implementation Steps
-        lines.append("## Implementation Steps")
-        lines.append("")
-        lines.append("1. **Generate Code Scaffolding**")
-        lines.append("   - Run the code generator to create function signatures")
-        lines.append("   - Review generated code structure and comments")
-        lines.append("")
-        lines.append("2. **Implement Functions**")
-        lines.append("   - Follow the algorithm steps in each function spec")
-        lines.append("   - Implement precondition validation first")
-        lines.append("   - Handle all error cases from the spec")
-        lines.append("   - Ensure postconditions are satisfied")
-        lines.append("")
-        lines.append("3. **Add Tests**")
-        lines.append("   - Create unit tests for each function")
-        lines.append("   - Test error cases and edge conditions")
-        lines.append("   - Verify contract compliance")
-        lines.append("")
-        lines.append("4. **Integration**")
-        lines.append("   - Wire up API routes if applicable")
-        lines.append("   - Test end-to-end flow")
-        lines.append("")
+        return '\n'.join(lines)
+    
+    def _render_function(self, func_path: str, func: Dict[str, Any]) -> str:
+        """Render one function's purpose, signature and contract."""
+        func_name = func.get('name', 'unknown')
+        func_purpose = func.get('purpose', '').strip().split('\n')[0]
         
-        # Verification
-        lines.append("## Verification")
-        lines.append("")
-        if verification:
-            for v in verification:
-                lines.append(f"- [ ] {v}")
-        else:
-            lines.append("- [ ] All functions implemented according to spec")
-            lines.append("- [ ] Unit tests pass")
-            lines.append("- [ ] Integration tests pass")
-            lines.append("- [ ] Code follows project style guidelines")
-        lines.append("")
+        lines = [
+            f"#### {func_name}",
+            f"- **Purpose**: {func_purpose}",
+        ]
+        
+        # Signature
+        sig = func.get('signature', {})
+        params = sig.get('parameters', [])
+        if params:
+            param_strs = ', '.join(
+                f"{p.get('name', 'arg')}: {p.get('type', 'any')}" for p in params
+            )
+            lines.append(f"- **Signature**: `{func_name}({param_strs})`")
+        
+        returns = sig.get('returns', {})
+        if returns:
+            lines.append(f"- **Returns**: `{returns.get('type', 'void')}` - {returns.get('description', '')}")
         
-        # Completion
-        lines.append("## Completion Checklist")
-        lines.append("")
-        lines.append("- [ ] All focus areas addressed")
-        lines.append("- [ ] All functions implemented")
-        lines.append("- [ ] Tests written and passing")
-        lines.append("- [ ] Code reviewed against spec")
-        lines.append("- [ ] Documentation updated if needed")
-        lines.append("")
-        lines.append("## Task Cleanup")
-        lines.append("")
-        lines.append("After completing the task:")
-        lines.append("```bash")
-        lines.append(f"python3 tools/task_cleanup.py --task-id {task_id}")
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append(f"*Generated: {datetime.now().isoformat()}*")
-        lines.append(f"*Spec Reference: python3 tools/doc_query.py --query &quot;{task_id}&quot; --mode task --pretty*")
+        # Contract
+        contract = func.get('contract', {})
+        preconditions = contract.get('preconditions', [])
+        if preconditions:
+            lines.append("- **Preconditions**:")
+            lines.extend(f"  - {pre}" for pre in preconditions[:3])  # Limit to first 3
         
+        postconditions = contract.get('postconditions', [])
+        if postconditions:
+            lines.append("- **Postconditions**:")
+            lines.extend(f"  - {post}" for post in postconditions[:3])  # Limit to first 3
+        
+        lines += [f"- **Spec**: `spec/functions/{func_path}`", ""]
         return '\n'.join(lines)
     
+    def _render_verification(self, verification: List[str]) -> str:
+        """Render the verification checklist."""
+        if verification:
+            items = '\n'.join(f"- [ ] {v}" for v in verification)
+        else:
+            items = _DEFAULT_VERIFICATION
+        return f"## Verification\n\n{items}\n"
+    
+    def _render_completion(self, task_id: str) -> str:
+        """Render the completion checklist and cleanup instructions."""
+        return '\n'.join([
+            _COMPLETION_CHECKLIST,
+            f"python3 tools/task_cleanup.py --task-id {task_id}",
+            "```",
+            "",
+            "---",
+            f"*Generated: {datetime.now().isoformat()}*",
+            f"*Spec Reference: python3 tools/doc_query.py --query &quot;{task_id}&quot; --mode task --pretty*",
+        ])
+    
     def save_prompt(self, task_id: str, content: str) -> Path:
         """Save prompt to file."""
         # Convert task_id to filename (e.g., 1.0.0 -> prompt_1_0_0.md)
         filename = f"prompt_{task_id.replace('.', '_')}.md"
         filepath = self.prompts_dir / filename
         
-        with open(filepath, 'w') as f:
-            f.write(content)
+        filepath.write_text(content)
         
         return filepath
     
-    def generate_and_save(self, task_id: str) -> Optional[Path]:
+    def generate_and_save(self, task_id: str, task: Optional[Dict[str, Any]] = None) -> Optional[Path]:
         """Generate and save a prompt for a task."""
-        content = self.generate_prompt(task_id)
+        content = self.generate_prompt(task_id, task)
         if content:
             filepath = self.save_prompt(task_id, content)
             print(f"✓ Generated prompt: {filepath}")
             return filepath
         return None
     
-    def generate_phase_prompts(self, phase: int) -> List[Path]:
-        """Generate prompts for all tasks in a phase."""
-        generated = []
+    def generate_phase_prompts(self, phase: int, force: bool = False) -> List[Path]:
+        """
+        Generate prompts for all tasks in a phase.
         
-        # Get all task IDs
-        all_ids = self.task_manager.get_all_task_ids()
+        Args:
+            phase: Phase number
+            force: Re-read spec files instead of reusing ones already loaded
+        """
+        if force:
+            self.clear_spec_cache()
+        
+        generated = []
         
-        # Filter by phase
+        # Filter by phase in one pass over master_todo's current and future tasks
         phase_prefix = f"{phase}."
         
-        for task_id in all_ids['current'] + all_ids['future']:
-            if str(task_id).startswith(phase_prefix):
-                filepath = self.generate_and_save(str(task_id))
+        for task_entry in self.task_manager.list_master_tasks():
+            task = task_entry['task']
+            task_id = task.get('id')
+            if task_id and str(task_id).startswith(phase_prefix):
+                filepath = self.generate_and_save(str(task_id), task)
                 if filepath:
                     generated.append(filepath)
         
         return generated
 
 
-def main():
-    """Main entry point."""
+# Options _fast_parse_args understands, by flag: (destination, takes a value)
+_CLI_OPTIONS = {
+    '--project-root': ('project_root', True),
+    '--task': ('task', True),
+    '--all-phase': ('all_phase', True),
+    '--preview': ('preview', False),
+}
+
+
+def _fast_parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common, well-formed command lines without argparse.
+    
+    Returns None for anything else (help, abbreviations, attached values,
+    missing or invalid arguments) so argparse handles it with its usual
+    messages.
+    """
+    args = SimpleNamespace(project_root='.', task=None, all_phase=None, preview=False)
+    i = 0
+    while i < len(argv):
+        option = _CLI_OPTIONS.get(argv[i])
+        if option is None:
+            return None
+        dest, takes_value = option
+        if takes_value:
+            if i + 1 >= len(argv) or argv[i + 1].startswith('-'):
+                return None
+            setattr(args, dest, argv[i + 1])
+            i += 2
+        else:
+            setattr(args, dest, True)
+            i += 1
+    
+    if args.all_phase is not None:
+        try:
+            args.all_phase = int(args.all_phase)
+        except ValueError:
+            return None
+    return args
+
+
+def _build_parser():
+    """Build the full argparse parser, only needed for help and errors."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Generate LLM prompts for tasks')
     parser.add_argument('--project-root', default='.', help='Project root directory')
     parser.add_argument('--task', help='Task ID to generate prompt for')
     parser.add_argument('--all-phase', type=int, help='Generate prompts for all tasks in a phase')
     parser.add_argument('--preview', action='store_true', help='Preview without saving')
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point."""
+    args = _fast_parse_args(sys.argv[1:]) or _build_parser().parse_args()
     
     generator = PromptGenerator(args.project_root)
     
@@ -344,7 +457,7 @@ def main():
         print(f"\n✓ Generated {len(generated)} prompts for Phase {args.all_phase}")
     
     else:
-        parser.print_help()
+        _build_parser().print_help()
 
 
 if __name__ == "__main__":
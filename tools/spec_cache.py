@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Spec Corpus Cache Module
+
+Parsing every spec file is the main start-up cost of the query and prompt
+tools, and each CLI invocation is a fresh process. This module keeps the
+whole parsed spec/ tree in one pickle under .cache/specs, keyed by a hash
+of every file's path, mtime and size, so a new process loads the corpus
+with a single read instead of one parse per file.
+
+Usage:
+    from spec_cache import load_all
+    specs = load_all(project_root)
+    module = specs.get('spec/modules/backend_node.yaml')
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+from yaml_db import CACHE_DIR, parse_yaml_file
+
+
+SPEC_CACHE_DIR = CACHE_DIR.parent / 'specs'
+
+_YAML_SUFFIXES = ('.yaml', '.yml')
+
+# Corpora already loaded by this process, keyed by corpus hash
+_LOADED: Dict[str, Dict[str, Any]] = {}
+
+
+def _corpus_files(base_path: Path) -> List[Tuple[str, int, int]]:
+    """List (relative path, mtime_ns, size) for every YAML file under spec/."""
+    files = []
+    for dir_path, dir_names, file_names in os.walk(base_path / 'spec'):
+        dir_names[:] = [name for name in dir_names if not name.startswith('.')]
+        for name in file_names:
+            if name.endswith(_YAML_SUFFIXES):
+                full_path = os.path.join(dir_path, name)
+                try:
+                    stat = os.stat(full_path)
+                except OSError:
+                    continue  # Removed since it was listed
+                files.append((os.path.relpath(full_path, base_path), stat.st_mtime_ns, stat.st_size))
+    files.sort()
+    return files
+
+
+def _corpus_hash(base_path: Path, files: List[Tuple[str, int, int]]) -> str:
+    """Hash the corpus location and file stamps."""
+    digest = hashlib.sha1(str(base_path.resolve()).encode('utf-8'))
+    for rel_path, mtime_ns, size in files:
+        digest.update(f"\0{rel_path}\0{mtime_ns}\0{size}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _read_pickle(cache_file: Path) -> Dict[str, Any]:
+    """Load a corpus pickle straight from a memory map of the file."""
+    with open(cache_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return pickle.loads(mapped)
+
+
+def _write_pickle(cache_file: Path, corpus: Dict[str, Any]) -> None:
+    """Atomically write a corpus pickle, replacing older ones for the same tree."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temp_path, 'wb') as f:
+            pickle.dump(corpus, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_file)
+    except (OSError, pickle.PicklingError):
+        return
+    
+    # Older corpora of this tree can never match again
+    for old_file in cache_file.parent.glob(f"{cache_file.stem.split('.')[0]}.*.pkl"):
+        if old_file != cache_file:
+            try:
+                old_file.unlink()
+            except OSError:
+                pass
+
+
+def load_stamped(base_path: Union[str, Path]) -> Dict[str, Tuple[Tuple[int, int], Any]]:
+    """
+    Load every spec file under base_path/spec, with the stamp it was parsed at.
+    
+    Args:
+        base_path: Project root
+        
+    Returns:
+        Dictionary mapping each file's path relative to base_path to its
+        ((mtime_ns, size), parsed document). Files that fail to parse are
+        left out, so callers can fall back to loading them directly and see
+        the error. Treat the documents as read-only: they are shared by
+        every caller.
+    """
+    base_path = Path(base_path)
+    files = _corpus_files(base_path)
+    corpus_hash = _corpus_hash(base_path, files)
+    
+    corpus = _LOADED.get(corpus_hash)
+    if corpus is not None:
+        return corpus
+    
+    # One pickle per tree (named by the hash of its location), suffixed by corpus
+    tree_hash = hashlib.sha1(str(base_path.resolve()).encode('utf-8')).hexdigest()[:16]
+    cache_file = SPEC_CACHE_DIR / f"{tree_hash}.{corpus_hash}.pkl"
+    try:
+        corpus = _read_pickle(cache_file)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        corpus = {}
+        for rel_path, mtime_ns, size in files:
+            try:
+                corpus[rel_path] = ((mtime_ns, size), parse_yaml_file(base_path / rel_path))
+            except Exception:
+                continue
+        _write_pickle(cache_file, corpus)
+    
+    _LOADED.clear()
+    _LOADED[corpus_hash] = corpus
+    return corpus
+
+
+def load_all(base_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load every spec file under base_path/spec, parsed.
+    
+    Same as load_stamped, without the stamps.
+    """
+    return {rel_path: data for rel_path, (_, data) in load_stamped(base_path).items()}
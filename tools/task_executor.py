@@ -5,7 +5,8 @@ Task Executor Tool for oinkerui Project (v2)
 Enhanced with EnhancedDocQuery integration for better context retrieval.
 
 This tool automates task execution:
-1. Reads task from master_todo.yaml using EnhancedDocQuery
+1. Reads task from master_todo.yaml using EnhancedDocQuery (--next picks
+   the task from master_todo.yaml loaded through yaml_db's shared cache)
 2. Generates orchestrator prompt with prompt_guidance
 3. Executes the task (or generates prompt for manual execution)
 4. Runs task cleanup tool
@@ -16,6 +17,7 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import subprocess
 import sys
@@ -28,6 +30,7 @@ import re
 # Import EnhancedDocQuery
 sys.path.insert(0, str(Path(__file__).parent))
 from doc_query import EnhancedDocQuery
+from yaml_db import load_yaml_shared
 
 def pretty_format(obj, indent=0, indent_step=2):
     """
@@ -97,6 +100,26 @@ def format_object(obj):
     """Public helper: call this with just your dict/list/etc."""
     return pretty_format(obj, indent=0, indent_step=2)
 
+
+# Template placeholders, such as {task_id}
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+
+@functools.lru_cache(maxsize=16)
+def _read_text(file_path: str, mtime_ns: int) -> str:
+    """Read a prompt file; the mtime in the key makes an edited file re-read."""
+    with open(file_path, 'r') as f:
+        return f.read()
+
+
+def _read_prompt_file(file_path: Path) -> Optional[str]:
+    """Read a prompt file through the cache, or return None if it doesn't exist."""
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _read_text(str(file_path), mtime_ns)
+
 class TaskExecutor:
     """Automates task execution and coordination."""
     
@@ -167,7 +190,7 @@ class TaskExecutor:
         print(f"=" * 70)
         print()
         
-        # Find next task using EnhancedDocQuery
+        # Find next task in master_todo.yaml
         next_task_id = self._find_next_task()
         if not next_task_id:
             print("❌ No tasks found in master_todo.yaml")
@@ -202,42 +225,44 @@ class TaskExecutor:
         return True
     
     def _find_next_task(self) -> Optional[str]:
-        """Find the next task in master_todo.yaml using EnhancedDocQuery."""
-        # Query for all current tasks
-        result = self.doc_query.query_path("current[*].task")
-        
-        if not result.get('matches'):
+        """Find the next task: the first one in master_todo.yaml's current section."""
+        master_todo = self._load_master_todo()
+        if not isinstance(master_todo, dict):
             return None
         
-        # Get the first task from master_todo.yaml
-        for match in result['matches']:
-            if match['file'] == 'master_todo.yaml' and match.get('results'):
-                first_task = match['results'][0]
-                task_data = first_task.get('value', {})
-                return str(task_data.get('id'))
+        for item in master_todo.get('current') or []:
+            if isinstance(item, dict) and isinstance(item.get('task'), dict):
+                return str(item['task'].get('id'))
         
         return None
+    
+    def _load_master_todo(self) -> Any:
+        """
+        Load master_todo.yaml, returning None if it is missing or invalid.
         
-
+        Unchanged content is read back from its JSON cache rather than
+        re-parsed; the document is shared, so it must not be modified.
+        """
+        try:
+            return load_yaml_shared(self.base_path / "master_todo.yaml")
+        except (OSError, yaml.YAMLError):
+            return None
+    
     def _generate_orchestrator_prompt(self, task_id: str) -> Optional[Path]:
         """Generate orchestrator prompt for the task."""
         print(f"Generating orchestrator prompt...")
         
         # Load prompt template
         template_path = self.base_path / "prompts" / "templates" / "dev" / "orchestrator_prompt.md"
-        if not template_path.exists():
+        template = _read_prompt_file(template_path)
+        if template is None:
             print(f"❌ Template not found: {template_path}")
             return None
         
-        with open(template_path, 'r') as f:
-            template = f.read()
-        
         # Load prompt_guidance
         guidance_path = self.base_path / "prompts" / "prompt_guidance.md"
-        if guidance_path.exists():
-            with open(guidance_path, 'r') as f:
-                self.prompt_guidance = f.read()
-        else:
+        self.prompt_guidance = _read_prompt_file(guidance_path)
+        if self.prompt_guidance is None:
             self.prompt_guidance = "(prompt_guidance.md not found)"
         
         # Get task details
@@ -253,28 +278,35 @@ class TaskExecutor:
         # Load task-specific prompt if it exists
         task_prompt_content = ""
         if task_prompt_file:
-            task_prompt_path = self.base_path / task_prompt_file
-            if task_prompt_path.exists():
-                with open(task_prompt_path, 'r') as f:
-                    task_prompt_content = f.read()
-        
-        # Generate context gathering commands using new predicate syntax
-        context_commands = self._generate_context_commands(task_id, task_files)
-        
-        # Fill in template variables
-        prompt = template.replace("{task_id}", str(task_id))
-        prompt = prompt.replace("{task_name}", task_name)
-        prompt = prompt.replace("{task_goal}", task_goal)
-
-        prompt = prompt.replace("{task_details}", format_object(task_details))
-        prompt = prompt.replace("{task_steps}", format_object(task_steps))
-        prompt = prompt.replace("{task_verify}", format_object(task_verify))
-
-
-        prompt = prompt.replace("{task_prompt_content}", task_prompt_content)
-        prompt = prompt.replace("{context_commands}", context_commands)
-        prompt = prompt.replace("{prompt_guidance}", self.prompt_guidance)
-        prompt = prompt.replace("{timestamp}", datetime.now().isoformat())
+            task_prompt_content = _read_prompt_file(self.base_path / task_prompt_file) or ""
+        
+        # Fill in template variables in one pass over the template. Each value
+        # is only built when its placeholder is there to take it (the template
+        # need not use all), and inserted values are not scanned again
+        fields = {
+            "task_id": lambda: str(task_id),
+            "task_name": lambda: task_name,
+            "task_goal": lambda: task_goal,
+            "task_details": lambda: format_object(task_details),
+            "task_steps": lambda: format_object(task_steps),
+            "task_verify": lambda: format_object(task_verify),
+            "task_prompt_content": lambda: task_prompt_content,
+            # Context gathering commands using new predicate syntax
+            "context_commands": lambda: self._generate_context_commands(task_id, task_files),
+            "prompt_guidance": lambda: self.prompt_guidance,
+            "timestamp": lambda: datetime.now().isoformat(),
+        }
+        values: Dict[str, str] = {}
+        
+        def fill(match: re.Match) -> str:
+            name = match.group(1)
+            if name not in fields:
+                return match.group(0)  # Not ours, e.g. {previous_task_id}
+            if name not in values:
+                values[name] = fields[name]()
+            return values[name]
+        
+        prompt = _PLACEHOLDER_RE.sub(fill, template)
         
         # Save orchestrator prompt
         output_path = self.base_path / "prompts" / "generated" / f"orchestrator_{task_id}.md"
@@ -15,14 +15,25 @@ Key Features:
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
+from copy import deepcopy
 import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from yaml_db import YAMLDatabase
+from yaml_db import YAMLDatabase, load_yaml_shared
+
+
+def _normalize_id(tid: Any) -> Any:
+    """Normalize a task ID so '1.0', 1.0 and 1 compare equal."""
+    if isinstance(tid, str):
+        try:
+            return float(tid)
+        except ValueError:
+            return tid
+    return tid
 
 
 class TaskManager:
@@ -44,6 +55,101 @@ class TaskManager:
         # Initialize databases
         self.master_todo_db = YAMLDatabase(self.master_todo_path)
         self.tasks_completed_db = YAMLDatabase(self.tasks_completed_path)
+        
+        # (mtime_ns, size), master_todo tasks and their ID index
+        self._master_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]] = None
+        # (mtime_ns, size) and tasks_completed's ID index
+        self._completed_cache: Optional[Tuple[Tuple[int, int], Dict[Any, Dict[str, Any]]]] = None
+    
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """Get a file's (mtime_ns, size), or None if it can't be read."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    @staticmethod
+    def _load_shared(path: Path) -> Dict[str, Any]:
+        """Load a task file's shared parsed document; never mutate it."""
+        if not path.exists():
+            raise FileNotFoundError(f"YAML file not found: {path}")
+        return load_yaml_shared(path) or {}
+    
+    def _master_tasks(self) -> Tuple[List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]:
+        """
+        Get master_todo.yaml's task entries and an index of them by normalized ID.
+        
+        Both are rebuilt only when the file's mtime or size changes. Current
+        tasks come before future ones, and the first entry wins in the index,
+        matching the search order of get_task_from_master.
+        """
+        stamp = self._file_stamp(self.master_todo_path)
+        
+        if stamp is None or self._master_cache is None or self._master_cache[0] != stamp:
+            data = self._load_shared(self.master_todo_path)
+            entries = []
+            index = {}
+            for section in ('current', 'future'):
+                for task_entry in data.get(section) or []:
+                    if not isinstance(task_entry, dict) or not isinstance(task_entry.get('task'), dict):
+                        continue
+                    entries.append(task_entry)
+                    try:
+                        index.setdefault(_normalize_id(task_entry['task'].get('id')), task_entry)
+                    except TypeError:
+                        pass  # Unhashable ID; it can never be looked up
+            self._master_cache = (stamp, entries, index)
+        
+        return self._master_cache[1], self._master_cache[2]
+    
+    def _completed_index(self) -> Dict[Any, Dict[str, Any]]:
+        """
+        Get tasks_completed.yaml's task entries by normalized ID.
+        
+        Rebuilt only when the file's mtime or size changes; the first entry
+        with an ID wins, as in a scan of the file.
+        """
+        stamp = self._file_stamp(self.tasks_completed_path)
+        
+        if stamp is None or self._completed_cache is None or self._completed_cache[0] != stamp:
+            data = self._load_shared(self.tasks_completed_path)
+            index = {}
+            for task_entry in data.get('tasks') or []:
+                task = task_entry.get('task', {}) if isinstance(task_entry, dict) else None
+                if not isinstance(task, dict):
+                    continue
+                try:
+                    index.setdefault(_normalize_id(task.get('id')), task_entry)
+                except TypeError:
+                    pass  # Unhashable ID; it can never be looked up
+            self._completed_cache = (stamp, index)
+        
+        return self._completed_cache[1]
+    
+    def is_in_master(self, task_id: Union[str, int, float]) -> bool:
+        """Check whether master_todo.yaml has a task with this ID, without copying it."""
+        try:
+            return _normalize_id(task_id) in self._master_tasks()[1]
+        except TypeError:
+            return False
+    
+    def is_completed(self, task_id: Union[str, int, float]) -> bool:
+        """Check whether tasks_completed.yaml has a task with this ID, without copying it."""
+        try:
+            return _normalize_id(task_id) in self._completed_index()
+        except TypeError:
+            return False
+    
+    def list_master_tasks(self) -> List[Dict[str, Any]]:
+        """
+        List all current and future task entries from master_todo.yaml.
+        
+        Returns:
+            Task entries, current ones first
+        """
+        return deepcopy(self._master_tasks()[0])
     
     def get_task_from_master(self, task_id: Union[str, int, float]) -> Optional[Dict[str, Any]]:
         """
@@ -55,35 +161,14 @@ class TaskManager:
         Returns:
             Task dictionary if found, None otherwise
         """
-        self.master_todo_db.load()
-        
-        # Normalize task_id for comparison
-        def normalize_id(tid):
-            if isinstance(tid, str):
-                try:
-                    return float(tid)
-                except ValueError:
-                    return tid
-            return tid
-        
-        normalized_search_id = normalize_id(task_id)
-        
-        # Check current tasks
-        current_tasks = self.master_todo_db.get('current', [])
-        for task_entry in current_tasks:
-            entry_id = task_entry.get('task', {}).get('id')
-            if normalize_id(entry_id) == normalized_search_id:
-                return task_entry
-        
-        # Check future tasks
-        future_tasks = self.master_todo_db.get('future', [])
-        for task_entry in future_tasks:
-            if isinstance(task_entry, dict):
-                entry_id = task_entry.get('task', {}).get('id')
-                if normalize_id(entry_id) == normalized_search_id:
-                    return task_entry
-        
-        return None
+        # Current tasks are indexed ahead of future ones
+        try:
+            task_entry = self._master_tasks()[1].get(_normalize_id(task_id))
+        except TypeError:
+            return None
+        
+        # Copy so callers can't modify the cached index
+        return deepcopy(task_entry) if task_entry is not None else None
     
     def get_task_from_completed(self, task_id: Union[str, int, float]) -> Optional[Dict[str, Any]]:
         """
@@ -95,26 +180,13 @@ class TaskManager:
         Returns:
             Task dictionary if found, None otherwise
         """
-        self.tasks_completed_db.load()
-        
-        # Normalize task_id for comparison
-        def normalize_id(tid):
-            if isinstance(tid, str):
-                try:
-                    return float(tid)
-                except ValueError:
-                    return tid
-            return tid
-        
-        normalized_search_id = normalize_id(task_id)
-        
-        tasks = self.tasks_completed_db.get('tasks', [])
-        for task_entry in tasks:
-            entry_id = task_entry.get('task', {}).get('id')
-            if normalize_id(entry_id) == normalized_search_id:
-                return task_entry
+        try:
+            task_entry = self._completed_index().get(_normalize_id(task_id))
+        except TypeError:
+            return None
         
-        return None
+        # Copy so callers can't modify the cached index
+        return deepcopy(task_entry) if task_entry is not None else None
     
     def move_task_to_completed(
         self,
@@ -177,20 +249,11 @@ class TaskManager:
         # Remove from master_todo.yaml
         self.master_todo_db.load()
         
-        # Normalize task_id for comparison
-        def normalize_id(tid):
-            if isinstance(tid, str):
-                try:
-                    return float(tid)
-                except ValueError:
-                    return tid
-            return tid
-        
-        normalized_search_id = normalize_id(task_id)
+        normalized_search_id = _normalize_id(task_id)
         
         # Remove from current tasks
         current_tasks = self.master_todo_db.get('current', [])
-        new_current = [t for t in current_tasks if normalize_id(t.get('task', {}).get('id')) != normalized_search_id]
+        new_current = [t for t in current_tasks if _normalize_id(t.get('task', {}).get('id')) != normalized_search_id]
         
         if len(new_current) < len(current_tasks):
             self.master_todo_db.set('current', new_current)
@@ -200,7 +263,7 @@ class TaskManager:
         
         # Remove from future tasks
         future_tasks = self.master_todo_db.get('future', [])
-        new_future = [t for t in future_tasks if not (isinstance(t, dict) and normalize_id(t.get('task', {}).get('id')) == normalized_search_id)]
+        new_future = [t for t in future_tasks if not (isinstance(t, dict) and _normalize_id(t.get('task', {}).get('id')) == normalized_search_id)]
         
         if len(new_future) < len(future_tasks):
             self.master_todo_db.set('future', new_future)
@@ -223,16 +286,7 @@ class TaskManager:
         """
         self.master_todo_db.load()
         
-        # Normalize task_id for comparison
-        def normalize_id(tid):
-            if isinstance(tid, str):
-                try:
-                    return float(tid)
-                except ValueError:
-                    return tid
-            return tid
-        
-        normalized_search_id = normalize_id(task_id)
+        normalized_search_id = _normalize_id(task_id)
         
         # Find task in future
         future_tasks = self.master_todo_db.get('future', [])
@@ -242,7 +296,7 @@ class TaskManager:
         for i, task_entry in enumerate(future_tasks):
             if isinstance(task_entry, dict) and 'task' in task_entry:
                 entry_id = task_entry.get('task', {}).get('id')
-                if normalize_id(entry_id) == normalized_search_id:
+                if _normalize_id(entry_id) == normalized_search_id:
                     task_to_move = task_entry
                     task_index = i
                     break
@@ -13,7 +13,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from yaml_db import YAMLDatabase
+from yaml_db import load_yaml_shared
 
 
 # Schema definitions
@@ -173,6 +173,14 @@ class SchemaValidator:
         return self.errors
 
 
+def _load_document(file_path: Path) -> Any:
+    """Load a file for validation; validation only reads, so no copy is made."""
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"YAML file not found: {file_path}")
+    data = load_yaml_shared(file_path)
+    return {} if data is None else data
+
+
 def validate_master_todo(file_path: Path) -> tuple[bool, List[str]]:
     """
     Validate master_todo.yaml file.
@@ -183,8 +191,7 @@ def validate_master_todo(file_path: Path) -> tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, errors)
     """
-    db = YAMLDatabase(file_path, create_backup=False)
-    data = db.load()
+    data = _load_document(file_path)
     
     validator = SchemaValidator(MASTER_TODO_SCHEMA)
     is_valid = validator.validate(data)
@@ -202,8 +209,7 @@ def validate_tasks_completed(file_path: Path) -> tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, errors)
     """
-    db = YAMLDatabase(file_path, create_backup=False)
-    data = db.load()
+    data = _load_document(file_path)
     
     validator = SchemaValidator(TASKS_COMPLETED_SCHEMA)
     is_valid = validator.validate(data)
@@ -16,12 +16,202 @@ Key Features:
 
 import yaml
 import json
+import hashlib
+import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 import shutil
+from collections import OrderedDict
 from copy import deepcopy
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+try:
+    import orjson
+except ImportError:  # optional; the JSON cache is read with json instead
+    orjson = None
+
+
+class _InterningLoader(_Loader):
+    """Safe loader that interns string mapping keys, which repeat across documents."""
+    
+    def construct_mapping(self, node, deep=False):
+        mapping = super().construct_mapping(node, deep=deep)
+        return {(sys.intern(key) if type(key) is str else key): value for key, value in mapping.items()}
+
+
+def _intern_pairs(pairs: List[tuple]) -> Dict[str, Any]:
+    """json object_pairs_hook interning keys the same way as _InterningLoader."""
+    return {sys.intern(key): value for key, value in pairs}
+
+
+# Parsed copies of YAML files are kept here as JSON, which loads much faster.
+# Each is named by a hash of the YAML file's path followed by a hash of its
+# content: an edited file maps to a new entry (its old one is then removed),
+# and a fresh checkout of unchanged files still hits the cache.
+CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'yaml'
+
+# Sidecar of each YAML file seen by this process, by absolute path, checked
+# against (mtime_ns, size), so a file's content is read and hashed once per
+# change rather than once per lookup
+_SIDECARS: Dict[str, Tuple[Tuple[int, int], Path]] = {}
+
+
+def _sidecar_path(source: str, content: bytes) -> Path:
+    """Get the JSON cache file for a YAML file's absolute path and content."""
+    prefix = hashlib.blake2b(os.fsencode(source), digest_size=8).hexdigest()
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    return CACHE_DIR / f"{prefix}.{digest}.json"
+
+
+def _locate_sidecar(file_path: Union[str, Path]) -> Tuple[str, Path, Optional[bytes]]:
+    """
+    Find a YAML file's JSON cache file.
+    
+    Returns:
+        Tuple of (absolute path of the YAML file, its cache file, its
+        content if it had to be read, else None)
+        
+    Raises:
+        OSError: If the file cannot be read
+    """
+    source = os.path.abspath(file_path)
+    stat = os.stat(source)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    known = _SIDECARS.get(source)
+    if known is not None and known[0] == stamp:
+        return source, known[1], None
+    
+    with open(source, 'rb') as f:
+        content = f.read()
+    sidecar = _sidecar_path(source, content)
+    _SIDECARS[source] = (stamp, sidecar)
+    return source, sidecar, content
+
+
+def _write_sidecar(sidecar: Path, data: Any) -> None:
+    """
+    Atomically write a JSON cache file, if the data survives JSON unchanged.
+    
+    Dates, non-string keys and the like would come back altered, so such
+    documents are never cached and always re-parsed from YAML. Cache files
+    of earlier versions of the same YAML file can never match again and
+    are removed.
+    """
+    try:
+        text = json.dumps(data, ensure_ascii=False)
+        if json.loads(text) != data:
+            return
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = sidecar.with_suffix(f'.{os.getpid()}.tmp')
+        temp_path.write_text(text, encoding='utf-8')
+        os.replace(temp_path, sidecar)
+    except (TypeError, ValueError, OSError):
+        return
+    
+    prefix = sidecar.name.split('.')[0]
+    for old_file in sidecar.parent.glob(f"{prefix}.*.json"):
+        if old_file != sidecar:
+            try:
+                old_file.unlink()
+            except OSError:
+                pass
+
+
+def has_fresh_cache(file_path: Union[str, Path]) -> bool:
+    """Check whether parse_yaml_file would be served from the JSON cache."""
+    try:
+        return _locate_sidecar(file_path)[1].exists()
+    except OSError:
+        return False
+
+
+def parse_yaml_file(file_path: Union[str, Path]) -> Any:
+    """
+    Parse a YAML file, reusing the JSON cache of its content when there is one.
+    
+    String mapping keys are interned, so documents share one object per key.
+    
+    Args:
+        file_path: Path to the YAML file
+        
+    Returns:
+        The parsed document
+        
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    source, sidecar, content = _locate_sidecar(file_path)
+    
+    try:
+        with open(sidecar, 'rb') as f:
+            cached = f.read()
+        # orjson reuses one string object per repeated key by itself
+        if orjson is not None:
+            return orjson.loads(cached)
+        return json.loads(cached, object_pairs_hook=_intern_pairs)
+    except (OSError, ValueError):
+        pass
+    
+    if content is None:
+        # The cache file was located from an earlier read; name it after
+        # exactly what is parsed now
+        with open(source, 'rb') as f:
+            content = f.read()
+        sidecar = _sidecar_path(source, content)
+    
+    # libyaml decodes the raw bytes itself
+    data = yaml.load(content, Loader=_InterningLoader)
+    
+    _write_sidecar(sidecar, data)
+    return data
+
+
+# Parsed documents shared within the process, keyed by path and checked
+# against (mtime_ns, size); least recently used drop first
+_DOC_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_DOC_CACHE_SIZE = 100
+
+
+def load_yaml_shared(file_path: Union[str, Path]) -> Any:
+    """
+    Parse a YAML file, reusing the document parsed earlier in this process.
+    
+    The document is reused while the file's mtime and size are unchanged.
+    It is shared by every caller, so treat it as read-only and deep-copy it
+    before making changes.
+    
+    Args:
+        file_path: Path to the YAML file
+        
+    Returns:
+        The parsed document
+        
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    key = os.fspath(file_path)
+    stat = os.stat(key)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _DOC_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        _DOC_CACHE.move_to_end(key)
+        return cached[1]
+    
+    data = parse_yaml_file(key)
+    _DOC_CACHE[key] = (stamp, data)
+    _DOC_CACHE.move_to_end(key)
+    if len(_DOC_CACHE) > _DOC_CACHE_SIZE:
+        _DOC_CACHE.popitem(last=False)
+    return data
+
 
 class YAMLDatabase:
     """
@@ -57,8 +247,8 @@ class YAMLDatabase:
         if not self.file_path.exists():
             raise FileNotFoundError(f"YAML file not found: {self.file_path}")
             
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            self.data = yaml.safe_load(f)
+        # Private copy: set() and append() modify self.data in place
+        self.data = deepcopy(load_yaml_shared(self.file_path))
             
         if self.data is None:
             self.data = {}
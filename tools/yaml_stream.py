@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+YAML Event Stream Module
+
+Scans a YAML document from its parser events instead of building the
+whole object tree, for the doc_query tools. Values are constructed the
+way yaml.load would construct them; documents using features these
+scans do not model raise StreamUnsupported so the caller can fall back
+to a full load.
+
+Usage:
+    from yaml_stream import StreamUnsupported, iter_nodes
+    for path, key, value, key_hit, is_leaf in iter_nodes(loader, match_key):
+        ...
+"""
+
+from typing import Any, Callable, Iterator, List, Tuple
+
+import yaml
+
+
+_STR_TAG = 'tag:yaml.org,2002:str'
+_MERGE_TAG = 'tag:yaml.org,2002:merge'
+_COLLECTION_STARTS = (yaml.MappingStartEvent, yaml.SequenceStartEvent)
+_COLLECTION_ENDS = (yaml.MappingEndEvent, yaml.SequenceEndEvent)
+
+# Key of the root node and of sequence items
+_NO_KEY = object()
+
+
+class StreamUnsupported(Exception):
+    """The event stream uses a feature the streaming scans do not model."""
+
+
+def _scalar(loader: Any, event: Any) -> Any:
+    """Construct a scalar event's value the way yaml.load would."""
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+    if tag == _STR_TAG:
+        return event.value
+    if tag == _MERGE_TAG:
+        raise StreamUnsupported("merge key")
+    node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, event.style)
+    return loader.construct_object(node)
+
+
+def _node(loader: Any) -> Tuple[Any, Any]:
+    """
+    Get the next node's start event, checking it is plain enough to stream.
+    
+    Raises:
+        StreamUnsupported: On aliases and explicitly tagged collections
+    """
+    event = loader.get_event()
+    event_type = type(event)
+    if event_type is yaml.AliasEvent:
+        raise StreamUnsupported("alias")
+    if event_type in _COLLECTION_STARTS and event.tag is not None and event.tag != '!':
+        raise StreamUnsupported("tagged collection")
+    return event, event_type
+
+
+def _key(loader: Any) -> Any:
+    """Read a mapping key, which must be a scalar."""
+    event, event_type = _node(loader)
+    if event_type is not yaml.ScalarEvent:
+        raise StreamUnsupported("complex key")
+    return _scalar(loader, event)
+
+
+def _build(loader: Any, event: Any) -> Any:
+    """Construct the node that starts with event, consuming the rest of it."""
+    if type(event) is yaml.ScalarEvent:
+        return _scalar(loader, event)
+    
+    root = {} if type(event) is yaml.MappingStartEvent else []
+    stack = [root]
+    while stack:
+        container = stack[-1]
+        if loader.check_event(*_COLLECTION_ENDS):
+            loader.get_event()
+            stack.pop()
+            continue
+        
+        key = _key(loader) if type(container) is dict else None
+        event, event_type = _node(loader)
+        if event_type is yaml.ScalarEvent:
+            value = _scalar(loader, event)
+        else:
+            value = {} if event_type is yaml.MappingStartEvent else []
+            stack.append(value)
+        
+        if type(container) is dict:
+            container[key] = value
+        else:
+            container.append(value)
+    return root
+
+
+def _skip(loader: Any, event: Any) -> None:
+    """
+    Consume the rest of the node that starts with event.
+    
+    Nothing is constructed except plain scalars whose constructor can
+    fail (timestamps) or that are merge keys, but everything yaml.load
+    would reject (or that _node refuses) still raises.
+    """
+    # Open collections: [is_mapping, next node is a key]
+    stack = []
+    while True:
+        event_type = type(event)
+        if event_type in _COLLECTION_ENDS:
+            stack.pop()
+            if not stack:
+                return
+            event = loader.get_event()
+            continue
+        
+        in_key = bool(stack) and stack[-1][0] and stack[-1][1]
+        if stack and stack[-1][0]:
+            stack[-1][1] = not in_key
+        
+        if event_type is yaml.AliasEvent:
+            raise StreamUnsupported("alias")
+        if event.tag is not None and event.tag != '!':
+            raise StreamUnsupported("tagged node")
+        if event_type is yaml.ScalarEvent:
+            if not event.style and (event.value[:1].isdigit() or event.value == '<<'):
+                _scalar(loader, event)
+        else:
+            if in_key:
+                raise StreamUnsupported("complex key")
+            stack.append([event_type is yaml.MappingStartEvent, True])
+        
+        if not stack:
+            return
+        event = loader.get_event()
+
+
+def _root(loader: Any) -> Tuple[Any, Any]:
+    """
+    Move to the document's root node.
+    
+    Raises:
+        StreamUnsupported: For empty streams, which yaml.load turns into None
+    """
+    loader.get_event()  # StreamStart
+    if not loader.check_event(yaml.DocumentStartEvent):
+        raise StreamUnsupported("empty stream")
+    loader.get_event()
+    return _node(loader)
+
+
+def _finish(loader: Any) -> None:
+    """Check the root node was the stream's only document, as yaml.load requires."""
+    loader.get_event()  # DocumentEnd
+    if not loader.check_event(yaml.StreamEndEvent):
+        raise StreamUnsupported("multiple documents")
+
+
+def iter_nodes(loader: Any, match_key: Callable[[str], Any]) -> Iterator[Tuple[Any, Any, Any, bool, bool]]:
+    """
+    Walk a document's nodes in document order, straight from the event stream.
+    
+    Yields (path, key, value, key_hit, is_leaf) for every node, with paths
+    written like "a.b[0].c". key_hit tells whether match_key accepted the
+    node's mapping key (as a string); the root and sequence items have
+    none. Scalars (leaves) are always constructed, but a collection's
+    value is only built (as the walk goes on) at or under a node whose
+    key matched, and is None elsewhere.
+    
+    Raises:
+        StreamUnsupported: For documents yaml.load would not turn into a
+            plain tree (aliases, merge keys, tagged collections, complex
+            or duplicate keys), for more than one document, and for an
+            empty or null document, which loads as None
+    """
+    event, event_type = _root(loader)
+    path, key, parent = "", _NO_KEY, None
+    # Open collections: [built container or None, path, is_mapping, next index, keys seen]
+    frames = []
+    
+    while True:
+        key_hit = key is not _NO_KEY and bool(match_key(key if type(key) is str else str(key)))
+        is_leaf = event_type is yaml.ScalarEvent
+        if is_leaf:
+            value = _scalar(loader, event)
+            if value is None and not frames:
+                raise StreamUnsupported("null document")
+        else:
+            is_mapping = event_type is yaml.MappingStartEvent
+            value = None
+            if parent is not None or key_hit:
+                value = {} if is_mapping else []
+        
+        if parent is not None:
+            if key is _NO_KEY:
+                parent.append(value)
+            else:
+                parent[key] = value
+        
+        yield path, key, value, key_hit, is_leaf
+        
+        if not is_leaf:
+            frames.append([value, path, is_mapping, 0, set() if is_mapping else None])
+        
+        # Move on to the next node, closing finished collections
+        while frames and loader.check_event(*_COLLECTION_ENDS):
+            loader.get_event()
+            frames.pop()
+        if not frames:
+            break
+        
+        frame = frames[-1]
+        parent = frame[0]
+        if frame[2]:
+            key = _key(loader)
+            if key in frame[4]:
+                # yaml.load keeps the last value, at the first key's position
+                raise StreamUnsupported("duplicate key")
+            frame[4].add(key)
+            path = f"{frame[1]}.{key}" if frame[1] else key
+        else:
+            key = _NO_KEY
+            path = f"{frame[1]}[{frame[3]}]"
+            frame[3] += 1
+        event, event_type = _node(loader)
+    
+    _finish(loader)
+
+
+def find_key_value(loader: Any, parts: List[str]) -> Any:
+    """
+    Get the value at a dotted key path from an event stream, or None.
+    
+    Only the value itself is constructed; every other subtree is skipped.
+    """
+    event, event_type = _root(loader)
+    if event_type is not yaml.MappingStartEvent:
+        _skip(loader, event)
+        _finish(loader)
+        return None
+    
+    value = None
+    # Keys seen in each open mapping along the path; its depth is the part it matches next
+    seen_stack = [set()]
+    while seen_stack:
+        if loader.check_event(yaml.MappingEndEvent):
+            loader.get_event()
+            seen_stack.pop()
+            continue
+        
+        depth = len(seen_stack) - 1
+        key = _key(loader)
+        if key in seen_stack[-1]:
+            raise StreamUnsupported("duplicate key")
+        seen_stack[-1].add(key)
+        
+        if type(key) is str and key == parts[depth]:
+            event, event_type = _node(loader)
+            if depth == len(parts) - 1:
+                value = _build(loader, event)
+            elif event_type is yaml.MappingStartEvent:
+                seen_stack.append(set())
+            else:
+                _skip(loader, event)
+        else:
+            _skip(loader, loader.get_event())
+    
+    _finish(loader)
+    return value
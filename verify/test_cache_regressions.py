@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the tools' caches and pre-filters
+
+Covers cases the faster code paths once got wrong:
+1. Text and path pre-filters on documents with date mapping keys
+2. Which files the doc_query tools discover
+3. TaskManager noticing tasks_completed.yaml being reverted
+4. Cached validation verdicts retiring when the validator changes
+
+Run this script from the project root directory.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from doc_query import EnhancedDocQuery
+from doc_query_old import DocQueryTool
+from task_manager import TaskManager
+import task_cleanup
+
+
+DATE_KEYED_YAML = """base:
+  name: foo
+changelog:
+  2024-01-01: released foo
+  2024-02-01:
+    x: y
+"""
+
+
+def _write(path: Path, text: str) -> None:
+    """Write a fixture file, giving it a newer mtime than any earlier version."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stamp = path.stat().st_mtime_ns + 1_000_000 if path.exists() else None
+    path.write_text(text)
+    if stamp is not None:
+        os.utime(path, ns=(stamp, stamp))
+
+
+def test_date_keyed_prefilters():
+    """Test text and path queries on date-keyed YAML, streamed and pre-filtered."""
+    print("Testing Date-Keyed YAML...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        _write(Path(tmp) / "spec" / "a.yaml", DATE_KEYED_YAML)
+        
+        streamed = EnhancedDocQuery(tmp)
+        # Files already loaded are screened with their JSON dump first
+        loaded = EnhancedDocQuery(tmp)
+        for file_path in loaded.yaml_files:
+            loaded._load_yaml_safe(file_path)
+        
+        for query_tool in (streamed, loaded):
+            result = query_tool.query_text("released")
+            paths = [match['path'] for found in result['matches'] for match in found['results']]
+            assert paths == ["changelog.2024-01-01"], paths
+        print("  ✓ Text search finds values under date keys")
+        
+        for query_tool in (streamed, loaded):
+            result = query_tool.query_path("base.name=foo")
+            assert len(result['matches']) == 1, result
+            result = query_tool.query_path("changelog.x=y")
+            assert result['matches'] == [], result
+        print("  ✓ Path queries run on date-keyed files")
+    
+    print("✅ All date-keyed YAML tests passed!\n")
+
+
+def test_discovery_file_set():
+    """Test that both query tools index the same YAML files."""
+    print("Testing File Discovery...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        for rel_name in ("top.yaml", "spec/a.yml", "spec/.hidden/b.yaml",
+                         "spec/node_modules/c.yaml", "log/__pycache__/d.yaml"):
+            _write(base / rel_name, "name: x\n")
+        _write(base / "spec" / "notes.txt", "name: x\n")
+        _write(base / "other" / "e.yaml", "name: x\n")
+        
+        expected = {"top.yaml", "spec/a.yml", "spec/.hidden/b.yaml",
+                    "spec/node_modules/c.yaml", "log/__pycache__/d.yaml"}
+        
+        def discovered(query_tool):
+            return {file_path.relative_to(base).as_posix() for file_path in query_tool.yaml_files}
+        
+        assert discovered(EnhancedDocQuery(tmp)) == expected, discovered(EnhancedDocQuery(tmp))
+        print("  ✓ doc_query lists every YAML file under the searched directories")
+        
+        # Twice: the second run reads the discovery cache
+        for _ in range(2):
+            found = discovered(DocQueryTool(tmp))
+            assert found == expected, found
+        
+        # A file added inside a hidden directory must show through the cache
+        _write(base / "spec" / ".hidden" / "f.yaml", "name: x\n")
+        found = discovered(DocQueryTool(tmp))
+        assert found == expected | {"spec/.hidden/f.yaml"}, found
+        print("  ✓ doc_query_old lists the same files, cached or not")
+    
+    print("✅ All file discovery tests passed!\n")
+
+
+def test_completion_tracks_yaml():
+    """Test that is_completed follows tasks_completed.yaml when it is reverted."""
+    print("Testing Completion Lookups...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        completed = base / "log" / "tasks_completed.yaml"
+        _write(base / "master_todo.yaml",
+               "current:\n- task:\n    id: '1.0'\n    name: done\nfuture: []\n")
+        _write(completed, "tasks: []\n")
+        reverted = completed.read_text()
+        
+        manager = TaskManager(tmp)
+        assert manager.move_task_to_completed("1.0")
+        assert manager.is_completed("1.0")
+        assert manager.is_completed(1)
+        print("  ✓ Completed task found")
+        
+        # Completion is only ever recorded in tasks_completed.yaml
+        assert sorted(path.name for path in completed.parent.iterdir()
+                      if not path.name.endswith(".bak")) == ["tasks_completed.yaml"]
+        
+        _write(completed, reverted)
+        assert not manager.is_completed("1.0")
+        assert manager.get_task_from_completed("1.0") is None
+        assert not TaskManager(tmp).is_completed("1.0")
+        print("  ✓ Reverted completion no longer reported")
+    
+    print("✅ All completion lookup tests passed!\n")
+
+
+def test_verdict_invalidation():
+    """Test that cached validation verdicts depend on the validator's source."""
+    print("Testing Verdict Cache Keys...")
+    
+    sources = task_cleanup._VALIDATOR_SOURCES
+    with tempfile.TemporaryDirectory() as tmp:
+        validator = Path(tmp) / "validator.py"
+        checked = Path(tmp) / "master_todo.yaml"
+        _write(validator, "RULES = 1\n")
+        _write(checked, "current: []\n")
+        schema = {"type": "object"}
+        
+        def verdict_path():
+            task_cleanup._validator_digest.cache_clear()
+            return task_cleanup._verdict_path(checked, schema)
+        
+        try:
+            task_cleanup._VALIDATOR_SOURCES = (str(validator),)
+            first = verdict_path()
+            assert verdict_path() == first
+            print("  ✓ Same inputs reuse the verdict")
+            
+            assert task_cleanup._verdict_path(checked, {"type": "array"}) != first
+            print("  ✓ Schema change retires the verdict")
+            
+            _write(validator, "RULES = 2\n")
+            assert verdict_path() != first
+            print("  ✓ Validator change retires the verdict")
+        finally:
+            task_cleanup._VALIDATOR_SOURCES = sources
+            task_cleanup._validator_digest.cache_clear()
+    
+    print("✅ All verdict cache tests passed!\n")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("CACHE REGRESSION TEST SUITE")
+    print("=" * 60)
+    print()
+    
+    try:
+        test_date_keyed_prefilters()
+        test_discovery_file_set()
+        test_completion_tracks_yaml()
+        test_verdict_invalidation()
+        
+        print("=" * 60)
+        print("✅ ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())